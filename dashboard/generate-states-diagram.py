@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """Generate visual diagram of all 5 dashboard states."""
 
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
 
@@ -22,6 +27,16 @@ BLACK = (0, 0, 0)
 # Font paths
 FONT_DIR = "/home/clsandoval/.claude/plugins/cache/anthropic-agent-skills/document-skills/f23222824449/skills/canvas-design/canvas-fonts"
 
+# Rendered panel cache (keyed by a hash of this script so edits invalidate it)
+CACHE_DIR = Path.home() / ".cache" / "slipstream"
+SCRIPT_HASH = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+
+# Sparkline points as fractions of the graph box (fixed seed for a stable image)
+SPARK_POINTS = 20
+_SPARK_X = np.arange(SPARK_POINTS) / (SPARK_POINTS - 1)
+_SPARK_Y = np.random.default_rng(42).random(SPARK_POINTS) * 0.6 + 0.2
+
+@lru_cache(maxsize=1)
 def load_fonts():
     return {
         'mono_bold': ImageFont.truetype(f"{FONT_DIR}/JetBrainsMono-Bold.ttf", 72),
@@ -34,165 +49,175 @@ def load_fonts():
         'sans_large': ImageFont.truetype(f"{FONT_DIR}/Outfit-Bold.ttf", 48),
     }
 
-def draw_voice_indicator(draw, x, y, status='listening'):
+def draw_voice_indicator(draw, x, y, fonts, status='listening'):
     """Draw voice indicator dot with label."""
     color = GREEN_500 if status == 'listening' else SLATE_400
     draw.ellipse([x, y, x+12, y+12], fill=color)
-    fonts = load_fonts()
     draw.text((x + 20, y - 3), status.capitalize(), fill=SLATE_400, font=fonts['sans_regular'])
 
 def draw_sparkline(draw, x, y, width, height):
     """Draw a simple sparkline graph."""
-    import random
-    random.seed(42)
-    points = []
-    for i in range(20):
-        px = x + (width * i / 19)
-        py = y + height - (random.random() * 0.6 + 0.2) * height
-        points.append((px, py))
-
-    for i in range(len(points) - 1):
-        draw.line([points[i], points[i+1]], fill=SKY_400, width=3)
-
-def draw_state_sleeping(draw, x, y, w, h, fonts):
-    """SLEEPING state - minimal clock on black."""
-    # Background
-    draw.rectangle([x, y, x+w, y+h], fill=BLACK)
-
-    # State label
-    draw.text((x + 20, y + 15), "SLEEPING", fill=SLATE_700, font=fonts['sans_title'])
-
-    # Clock centered
-    clock_text = "02:34"
-    bbox = draw.textbbox((0, 0), clock_text, font=fonts['mono_bold'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2, y + h // 2 - 30), clock_text, fill=SLATE_700, font=fonts['mono_bold'])
-
-def draw_state_standby(draw, x, y, w, h, fonts):
-    """STANDBY state - ready to swim."""
-    # Background
-    draw.rectangle([x, y, x+w, y+h], fill=SLATE_900)
-
-    # State label
-    draw.text((x + 20, y + 15), "STANDBY", fill=SLATE_400, font=fonts['sans_title'])
-
-    # Clock
-    clock_text = "14:32"
-    bbox = draw.textbbox((0, 0), clock_text, font=fonts['mono_bold'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2, y + 80), clock_text, fill=WHITE, font=fonts['mono_bold'])
-
-    # Ready message
-    msg = "Ready to swim"
-    bbox = draw.textbbox((0, 0), msg, font=fonts['sans_bold'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2, y + 170), msg, fill=SLATE_400, font=fonts['sans_bold'])
-
-    # Voice indicator
-    draw_voice_indicator(draw, x + w - 130, y + h - 35, 'listening')
-
-def draw_state_swimming(draw, x, y, w, h, fonts):
-    """SWIMMING state - giant stroke rate."""
+    xs = x + width * _SPARK_X
+    ys = y + height - _SPARK_Y * height
+    draw.line(list(zip(xs.tolist(), ys.tolist())), fill=SKY_400, width=3)
+
+# Panel specs. Coordinates are relative to the panel: negative x/y count back
+# from the right/bottom edge, ('mid', n) is w // 2 + n, ('middle', n) is
+# h // 2 + n, ('center', n) centers the text with an offset, and ('after', n)
+# starts n pixels past the end of the last centered text.
+STATES = {
+    'sleeping': {
+        'bg': BLACK,
+        'label': "SLEEPING",
+        'label_color': SLATE_700,
+        'elements': [
+            {'kind': 'text', 'text': "02:34", 'font': 'mono_bold', 'color': SLATE_700,
+             'x': 'center', 'y': ('middle', -30)},
+        ],
+    },
+    'standby': {
+        'bg': SLATE_900,
+        'label': "STANDBY",
+        'label_color': SLATE_400,
+        'elements': [
+            {'kind': 'text', 'text': "14:32", 'font': 'mono_bold', 'color': WHITE,
+             'x': 'center', 'y': 80},
+            {'kind': 'text', 'text': "Ready to swim", 'font': 'sans_bold', 'color': SLATE_400,
+             'x': 'center', 'y': 170},
+            {'kind': 'voice', 'x': -130, 'y': -35},
+        ],
+    },
+    'swimming': {
+        'bg': SLATE_900,
+        'label': "SWIMMING",
+        'label_color': SKY_400,
+        'elements': [
+            {'kind': 'text', 'text': "5:00", 'font': 'mono_medium', 'color': WHITE,
+             'x': 'center', 'y': 50},
+            {'kind': 'text', 'text': "54", 'font': 'mono_giant', 'color': WHITE,
+             'x': ('center', -30), 'y': 90},
+            {'kind': 'text', 'text': "/min", 'font': 'sans_regular', 'color': SLATE_400,
+             'x': ('after', 10), 'y': 100},
+            {'kind': 'text', 'text': "↔", 'font': 'sans_bold', 'color': WHITE,
+             'x': ('after', 10), 'y': 130},
+            {'kind': 'sparkline', 'box': (40, 210, -40, 250)},
+            {'kind': 'voice', 'x': -130, 'y': -35},
+        ],
+    },
+    'resting': {
+        'bg': SLATE_900,
+        'label': "RESTING",
+        'label_color': GREEN_500,
+        'elements': [
+            # Header row
+            {'kind': 'text', 'text': "6:00", 'font': 'mono_medium', 'color': WHITE, 'x': 25, 'y': 45},
+            {'kind': 'text', 'text': "SESSION", 'font': 'sans_title', 'color': SLATE_400, 'x': 25, 'y': 85},
+            {'kind': 'text', 'text': "REST", 'font': 'sans_bold', 'color': WHITE, 'x': -100, 'y': 45},
+            {'kind': 'text', 'text': "0:45", 'font': 'mono_small', 'color': SLATE_400, 'x': -100, 'y': 75},
+            {'kind': 'line', 'box': (20, 115, -20, 115), 'color': SLATE_700},
+            # Two columns
+            {'kind': 'text', 'text': "LAST INTERVAL", 'font': 'sans_title', 'color': SLATE_400, 'x': 25, 'y': 125},
+            {'kind': 'text', 'text': "Avg: 52 /min", 'font': 'sans_regular', 'color': WHITE, 'x': 25, 'y': 148},
+            {'kind': 'text', 'text': "Est: 324m", 'font': 'sans_regular', 'color': WHITE, 'x': 25, 'y': 172},
+            {'kind': 'text', 'text': "Strokes: 180", 'font': 'sans_regular', 'color': WHITE, 'x': 25, 'y': 196},
+            {'kind': 'text', 'text': "NEXT UP", 'font': 'sans_title', 'color': SLATE_400, 'x': ('mid', 10), 'y': 125},
+            {'kind': 'text', 'text': "Interval 2/4", 'font': 'sans_regular', 'color': WHITE, 'x': ('mid', 10), 'y': 148},
+            {'kind': 'text', 'text': "4:00 duration", 'font': 'sans_regular', 'color': WHITE, 'x': ('mid', 10), 'y': 172},
+            # Coach message box
+            {'kind': 'rect', 'box': (20, 230, -20, 275), 'color': SLATE_800},
+            {'kind': 'text', 'text': "COACH:", 'font': 'sans_title', 'color': SLATE_400, 'x': 30, 'y': 243},
+            {'kind': 'text', 'text': "Ready when you are!", 'font': 'sans_regular', 'color': WHITE, 'x': 95, 'y': 243},
+            {'kind': 'voice', 'x': 25, 'y': -35},
+        ],
+    },
+    'summary': {
+        'bg': SLATE_900,
+        'label': "SUMMARY",
+        'label_color': SLATE_400,
+        'elements': [
+            {'kind': 'text', 'text': "Session Complete", 'font': 'sans_large', 'color': WHITE,
+             'x': 'center', 'y': 50},
+            # Stats grid 2x2
+            {'kind': 'text', 'text': "DURATION", 'font': 'sans_title', 'color': SLATE_400, 'x': 40, 'y': 130},
+            {'kind': 'text', 'text': "6:00", 'font': 'mono_medium', 'color': WHITE, 'x': 40, 'y': 155},
+            {'kind': 'text', 'text': "DISTANCE", 'font': 'sans_title', 'color': SLATE_400, 'x': ('mid', 20), 'y': 130},
+            {'kind': 'text', 'text': "324m", 'font': 'mono_medium', 'color': WHITE, 'x': ('mid', 20), 'y': 155},
+            {'kind': 'text', 'text': "STROKES", 'font': 'sans_title', 'color': SLATE_400, 'x': 40, 'y': 210},
+            {'kind': 'text', 'text': "180", 'font': 'mono_medium', 'color': WHITE, 'x': 40, 'y': 235},
+            {'kind': 'text', 'text': "AVG RATE", 'font': 'sans_title', 'color': SLATE_400, 'x': ('mid', 20), 'y': 210},
+            {'kind': 'text', 'text': "52/min", 'font': 'mono_medium', 'color': WHITE, 'x': ('mid', 20), 'y': 235},
+        ],
+    },
+}
+
+# (text, id(font)) -> rendered width; fonts live for the whole run via load_fonts()
+_TEXT_WIDTH_CACHE = {}
+
+def text_width(draw, text, font):
+    """Rendered width of text in the given font (memoized)."""
+    key = (text, id(font))
+    width = _TEXT_WIDTH_CACHE.get(key)
+    if width is None:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        width = _TEXT_WIDTH_CACHE[key] = bbox[2] - bbox[0]
+    return width
+
+def _resolve(value, size):
+    """Resolve a panel-relative coordinate (negative counts from the far edge)."""
+    if isinstance(value, tuple):
+        return size // 2 + value[1]
+    return value if value >= 0 else size + value
+
+def render_state(draw, x, y, w, h, spec, fonts):
+    """Draw one dashboard state panel from its spec."""
     # Background
-    draw.rectangle([x, y, x+w, y+h], fill=SLATE_900)
+    draw.rectangle([x, y, x+w, y+h], fill=spec['bg'])
 
     # State label
-    draw.text((x + 20, y + 15), "SWIMMING", fill=SKY_400, font=fonts['sans_title'])
-
-    # Timer at top
-    timer = "5:00"
-    bbox = draw.textbbox((0, 0), timer, font=fonts['mono_medium'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2, y + 50), timer, fill=WHITE, font=fonts['mono_medium'])
-
-    # Giant stroke rate
-    rate = "54"
-    bbox = draw.textbbox((0, 0), rate, font=fonts['mono_giant'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2 - 30, y + 90), rate, fill=WHITE, font=fonts['mono_giant'])
-
-    # /min label and trend
-    draw.text((x + (w + tw) // 2 - 20, y + 100), "/min", fill=SLATE_400, font=fonts['sans_regular'])
-    draw.text((x + (w + tw) // 2 - 20, y + 130), "↔", fill=WHITE, font=fonts['sans_bold'])
-
-    # Sparkline
-    draw_sparkline(draw, x + 40, y + 210, w - 80, 40)
-
-    # Voice indicator
-    draw_voice_indicator(draw, x + w - 130, y + h - 35, 'listening')
-
-def draw_state_resting(draw, x, y, w, h, fonts):
-    """RESTING state - expanded info."""
-    # Background
-    draw.rectangle([x, y, x+w, y+h], fill=SLATE_900)
-
-    # State label
-    draw.text((x + 20, y + 15), "RESTING", fill=GREEN_500, font=fonts['sans_title'])
-
-    # Header row
-    draw.text((x + 25, y + 45), "6:00", fill=WHITE, font=fonts['mono_medium'])
-    draw.text((x + 25, y + 85), "SESSION", fill=SLATE_400, font=fonts['sans_title'])
-
-    draw.text((x + w - 100, y + 45), "REST", fill=WHITE, font=fonts['sans_bold'])
-    draw.text((x + w - 100, y + 75), "0:45", fill=SLATE_400, font=fonts['mono_small'])
-
-    # Divider
-    draw.line([(x + 20, y + 115), (x + w - 20, y + 115)], fill=SLATE_700, width=1)
-
-    # Two columns
-    col1_x = x + 25
-    col2_x = x + w // 2 + 10
-
-    draw.text((col1_x, y + 125), "LAST INTERVAL", fill=SLATE_400, font=fonts['sans_title'])
-    draw.text((col1_x, y + 148), "Avg: 52 /min", fill=WHITE, font=fonts['sans_regular'])
-    draw.text((col1_x, y + 172), "Est: 324m", fill=WHITE, font=fonts['sans_regular'])
-    draw.text((col1_x, y + 196), "Strokes: 180", fill=WHITE, font=fonts['sans_regular'])
-
-    draw.text((col2_x, y + 125), "NEXT UP", fill=SLATE_400, font=fonts['sans_title'])
-    draw.text((col2_x, y + 148), "Interval 2/4", fill=WHITE, font=fonts['sans_regular'])
-    draw.text((col2_x, y + 172), "4:00 duration", fill=WHITE, font=fonts['sans_regular'])
-
-    # Coach message box
-    draw.rectangle([x + 20, y + 230, x + w - 20, y + 275], fill=SLATE_800, outline=None)
-    draw.text((x + 30, y + 243), "COACH:", fill=SLATE_400, font=fonts['sans_title'])
-    draw.text((x + 95, y + 243), "Ready when you are!", fill=WHITE, font=fonts['sans_regular'])
-
-    # Voice indicator
-    draw_voice_indicator(draw, x + 25, y + h - 35, 'listening')
-
-def draw_state_summary(draw, x, y, w, h, fonts):
-    """SUMMARY state - session complete."""
-    # Background
-    draw.rectangle([x, y, x+w, y+h], fill=SLATE_900)
-
-    # State label
-    draw.text((x + 20, y + 15), "SUMMARY", fill=SLATE_400, font=fonts['sans_title'])
-
-    # Title
-    title = "Session Complete"
-    bbox = draw.textbbox((0, 0), title, font=fonts['sans_large'])
-    tw = bbox[2] - bbox[0]
-    draw.text((x + (w - tw) // 2, y + 50), title, fill=WHITE, font=fonts['sans_large'])
-
-    # Stats grid 2x2
-    stats = [
-        ("DURATION", "6:00"),
-        ("DISTANCE", "324m"),
-        ("STROKES", "180"),
-        ("AVG RATE", "52/min"),
-    ]
-
-    positions = [
-        (x + 40, y + 130),
-        (x + w // 2 + 20, y + 130),
-        (x + 40, y + 210),
-        (x + w // 2 + 20, y + 210),
-    ]
-
-    for i, (label, value) in enumerate(stats):
-        px, py = positions[i]
-        draw.text((px, py), label, fill=SLATE_400, font=fonts['sans_title'])
-        draw.text((px, py + 25), value, fill=WHITE, font=fonts['mono_medium'])
+    draw.text((x + 20, y + 15), spec['label'], fill=spec['label_color'], font=fonts['sans_title'])
+
+    anchor_end = 0
+    for el in spec['elements']:
+        kind = el['kind']
+        if kind == 'text':
+            font = fonts[el['font']]
+            px = ('center', 0) if el['x'] == 'center' else el['x']
+            mode = px[0] if isinstance(px, tuple) else None
+            if mode == 'center':
+                tw = text_width(draw, el['text'], font)
+                px = (w - tw) // 2 + px[1]
+                anchor_end = px + tw
+            elif mode == 'after':
+                px = anchor_end + px[1]
+            else:
+                px = _resolve(px, w)
+            draw.text((x + px, y + _resolve(el['y'], h)), el['text'], fill=el['color'], font=font)
+        elif kind in ('rect', 'line', 'sparkline'):
+            x0, y0, x1, y1 = el['box']
+            x0, x1 = x + _resolve(x0, w), x + _resolve(x1, w)
+            y0, y1 = y + _resolve(y0, h), y + _resolve(y1, h)
+            if kind == 'rect':
+                draw.rectangle([x0, y0, x1, y1], fill=el['color'], outline=None)
+            elif kind == 'line':
+                draw.line([(x0, y0), (x1, y1)], fill=el['color'], width=1)
+            else:
+                draw_sparkline(draw, x0, y0, x1 - x0, y1 - y0)
+        elif kind == 'voice':
+            draw_voice_indicator(draw, x + _resolve(el['x'], w), y + _resolve(el['y'], h), fonts, 'listening')
+
+def render_panel(name, w, h, fonts):
+    """Render a state panel once and reuse the cached tile on later runs."""
+    path = CACHE_DIR / f"{name}_{w}x{h}_{SCRIPT_HASH}.png"
+    if path.exists():
+        return Image.open(path)
+
+    # Rectangles are inclusive of their end coordinate, hence the +1
+    panel = Image.new('RGB', (w + 1, h + 1), SLATE_800)
+    render_state(ImageDraw.Draw(panel), 0, 0, w, h, STATES[name], fonts)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    panel.save(path, 'PNG', compress_level=1)
+    return panel
 
 def main():
     # Create canvas
@@ -215,14 +240,14 @@ def main():
     start_y = 160
 
     # Row 1: SLEEPING, STANDBY, SWIMMING
-    draw_state_sleeping(draw, 60, start_y, state_w, state_h, fonts)
-    draw_state_standby(draw, 60 + state_w + padding, start_y, state_w, state_h, fonts)
-    draw_state_swimming(draw, 60 + 2 * (state_w + padding), start_y, state_w, state_h, fonts)
+    img.paste(render_panel('sleeping', state_w, state_h, fonts), (60, start_y))
+    img.paste(render_panel('standby', state_w, state_h, fonts), (60 + state_w + padding, start_y))
+    img.paste(render_panel('swimming', state_w, state_h, fonts), (60 + 2 * (state_w + padding), start_y))
 
     # Row 2: RESTING (wide), SUMMARY
     resting_w = state_w + 200
-    draw_state_resting(draw, 60, start_y + state_h + padding, resting_w, state_h, fonts)
-    draw_state_summary(draw, 60 + resting_w + padding, start_y + state_h + padding, state_w + 160, state_h, fonts)
+    img.paste(render_panel('resting', resting_w, state_h, fonts), (60, start_y + state_h + padding))
+    img.paste(render_panel('summary', state_w + 160, state_h, fonts), (60 + resting_w + padding, start_y + state_h + padding))
 
     # State flow arrows and labels at bottom
     flow_y = HEIGHT - 100
@@ -236,7 +261,8 @@ def main():
 
     # Save
     output_path = "/home/clsandoval/cs/slipstream/dashboard/dashboard-states.png"
-    img.save(output_path, 'PNG', quality=95)
+    # Fast DEFLATE for iteration; set SLIPSTREAM_PNG_LEVEL=9 for a smaller committed file
+    img.save(output_path, 'PNG', compress_level=int(os.environ.get('SLIPSTREAM_PNG_LEVEL', '1')))
     print(f"Saved to {output_path}")
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 """MCP message models."""
 
-from src.mcp.models.messages import SessionState, SystemState, StateUpdate
+from src.mcp.models.messages import (
+    SessionState,
+    StateUpdate,
+    SystemState,
+    WorkoutStateMessage,
+)
 
-__all__ = ["SessionState", "SystemState", "StateUpdate"]
+__all__ = ["SessionState", "SystemState", "StateUpdate", "WorkoutStateMessage"]
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Current swim session state."""
 
@@ -31,7 +31,7 @@ class SessionState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemState:
     """Current system status."""
 
@@ -48,7 +48,7 @@ class SystemState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutStateMessage:
     """Workout state for WebSocket broadcast."""
 
@@ -83,65 +83,100 @@ class WorkoutStateMessage:
         )
 
 
-def _current_timestamp() -> str:
-    """Get current UTC timestamp in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+# Shared compact encoder: payloads are flat and acyclic, so skip the
+# circular-reference bookkeeping and the whitespace in separators.
+_json_encoder = json.JSONEncoder(separators=(",", ":"), check_circular=False)
 
 
-@dataclass
+# (whole second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) for the most recent
+# second. Kept as one tuple, read once and replaced in a single assignment, so
+# callers on other threads never pair a second with another second's prefix.
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def current_timestamp() -> str:
+    """Get current UTC timestamp in ISO format.
+
+    Matches datetime.now(timezone.utc).isoformat(), but reuses the
+    formatted date/time prefix while the wall-clock second is unchanged.
+    """
+    global _timestamp_cache
+
+    now = time.time()
+    seconds = int(now)
+    cached_second, prefix = _timestamp_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+
+    micros = int((now - seconds) * 1_000_000)
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+@dataclass(slots=True)
 class StateUpdate:
     """State update message for WebSocket broadcast."""
 
     type: str = "state_update"
-    timestamp: str = field(default_factory=_current_timestamp)
+    timestamp: str = field(default_factory=current_timestamp)
     session: SessionState = field(default_factory=SessionState)
     system: SystemState = field(default_factory=SystemState)
     workout: WorkoutStateMessage | None = None
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        data = {
-            "type": self.type,
-            "timestamp": self.timestamp,
-            "session": self.session.to_dict(),
-            "system": self.system.to_dict(),
-            "workout": self.workout.to_dict() if self.workout else None,
-        }
-        return json.dumps(data)
+        session = self.session
+        system = self.system
+        workout = self.workout
+        return _json_encoder.encode(
+            {
+                "type": self.type,
+                "timestamp": self.timestamp,
+                "session": {
+                    "active": session.active,
+                    "elapsed_seconds": session.elapsed_seconds,
+                    "stroke_count": session.stroke_count,
+                    "stroke_rate": session.stroke_rate,
+                    "stroke_rate_trend": session.stroke_rate_trend,
+                    "estimated_distance_m": session.estimated_distance_m,
+                },
+                "system": {
+                    "is_swimming": system.is_swimming,
+                    "pose_detected": system.pose_detected,
+                    "voice_state": system.voice_state,
+                },
+                "workout": workout.to_dict() if workout else None,
+            }
+        )
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> StateUpdate:
         """Create StateUpdate from dictionary."""
-        session_data = data.get("session", {})
-        system_data = data.get("system", {})
+        session_get = data.get("session", {}).get
+        system_get = data.get("system", {}).get
         workout_data = data.get("workout")
 
-        workout = None
-        if workout_data:
-            workout = WorkoutStateMessage(
-                has_active_workout=workout_data.get("has_active_workout", False),
-                phase=workout_data.get("phase", "no_workout"),
-                workout_name=workout_data.get("workout_name"),
-                current_segment=workout_data.get("current_segment"),
-                progress=workout_data.get("progress"),
-                next_segment=workout_data.get("next_segment"),
-            )
-
         return cls(
             type=data.get("type", "state_update"),
-            timestamp=data.get("timestamp", _current_timestamp()),
+            timestamp=(
+                data["timestamp"] if "timestamp" in data else current_timestamp()
+            ),
             session=SessionState(
-                active=session_data.get("active", False),
-                elapsed_seconds=session_data.get("elapsed_seconds", 0),
-                stroke_count=session_data.get("stroke_count", 0),
-                stroke_rate=session_data.get("stroke_rate", 0.0),
-                stroke_rate_trend=session_data.get("stroke_rate_trend", "stable"),
-                estimated_distance_m=session_data.get("estimated_distance_m", 0.0),
+                active=session_get("active", False),
+                elapsed_seconds=session_get("elapsed_seconds", 0),
+                stroke_count=session_get("stroke_count", 0),
+                stroke_rate=session_get("stroke_rate", 0.0),
+                stroke_rate_trend=session_get("stroke_rate_trend", "stable"),
+                estimated_distance_m=session_get("estimated_distance_m", 0.0),
             ),
             system=SystemState(
-                is_swimming=system_data.get("is_swimming", False),
-                pose_detected=system_data.get("pose_detected", False),
-                voice_state=system_data.get("voice_state", "idle"),
+                is_swimming=system_get("is_swimming", False),
+                pose_detected=system_get("pose_detected", False),
+                voice_state=system_get("voice_state", "idle"),
+            ),
+            workout=(
+                WorkoutStateMessage.from_status(workout_data) if workout_data else None
             ),
-            workout=workout,
         )
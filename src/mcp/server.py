@@ -5,19 +5,18 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
 
 from src.mcp.state_store import StateStore
 from src.mcp.storage.config import Config
 from src.mcp.storage.session_storage import SessionStorage
-from src.mcp.tools.metric_bridge import MetricBridge
 from src.mcp.tools.session_tools import create_session_tools
 from src.mcp.tools.swim_tools import create_swim_tools
-from src.mcp.websocket_server import WebSocketServer
-from src.notifications.manager import NotificationManager
-from src.vision.state_store import StateStore as VisionStateStore
+
+if TYPE_CHECKING:
+    from src.vision.state_store import StateStore as VisionStateStore
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +26,16 @@ def _default_config_dir() -> Path:
     return Path.home() / ".slipstream"
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed."""
+    try:
+        import uvloop
+
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
+
+
 class SwimCoachServer:
     """MCP server for swim coaching with WebSocket state push."""
 
@@ -45,6 +54,13 @@ class SwimCoachServer:
             config_dir: Directory for config and session files
             vision_state_store: Vision pipeline state store (creates default if None)
         """
+        # Deferred so importing this module doesn't pull in the WebSocket,
+        # vision and notification stacks
+        from src.mcp.tools.metric_bridge import MetricBridge
+        from src.mcp.websocket_server import WebSocketServer
+        from src.notifications.manager import NotificationManager
+        from src.vision.state_store import StateStore as VisionStateStore
+
         self.config_dir = config_dir or _default_config_dir()
         self.config_dir.mkdir(parents=True, exist_ok=True)
         (self.config_dir / "sessions").mkdir(exist_ok=True)
@@ -111,7 +127,7 @@ class SwimCoachServer:
     def run(self) -> None:
         """Run the MCP server (main entry point for stdio transport)."""
         # Start WebSocket server in background
-        loop = asyncio.new_event_loop()
+        loop = _new_event_loop()
         asyncio.set_event_loop(loop)
 
         try:
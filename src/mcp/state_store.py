@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
-from src.mcp.models.messages import SessionState, SystemState, StateUpdate
+from src.mcp.models.messages import (
+    SessionState,
+    StateUpdate,
+    SystemState,
+    current_timestamp,
+)
 
 if TYPE_CHECKING:
     from src.notifications.manager import NotificationManager
     from src.vision.state_store import SwimState
 
 
+# Number of recent stroke rates kept for trend and average calculation
+_RATE_HISTORY_LEN = 10
+
+
 class SessionActiveError(Exception):
     """Raised when attempting to start a session while one is active."""
 
@@ -28,17 +39,49 @@ class NoActiveSessionError(Exception):
 
 @dataclass
 class StateStore:
-    """Thread-safe in-memory state for swim sessions."""
+    """Thread-safe in-memory state for swim sessions.
+
+    Session and system state are published together as an immutable
+    snapshot tuple. Writers serialize on ``_lock``, build replacement
+    objects and swap the tuple reference; readers load the tuple without
+    locking.
+    """
 
-    session: SessionState = field(default_factory=SessionState)
-    system: SystemState = field(default_factory=SystemState)
     dps_ratio: float = 1.8
     notification_manager: "NotificationManager | None" = None
     _session_id: str | None = field(default=None, repr=False)
     _started_at: datetime | None = field(default=None, repr=False)
-    _stroke_rate_history: list[float] = field(default_factory=list, repr=False)
+    _started_monotonic: float | None = field(default=None, repr=False)
+    _stroke_rate_history: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_RATE_HISTORY_LEN), repr=False
+    )
+    _stroke_rate_sum: float = field(default=0.0, repr=False)
+    _snapshot: tuple[SessionState, SystemState] = field(
+        default_factory=lambda: (SessionState(), SystemState()), repr=False
+    )
+    _version: int = field(default=0, repr=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
+    @property
+    def version(self) -> int:
+        """Counter bumped by every write; unchanged means the state is too."""
+        return self._version
+
+    @property
+    def started_at(self) -> datetime | None:
+        """UTC start time of the active session, or None when idle."""
+        return self._started_at
+
+    @property
+    def session(self) -> SessionState:
+        """Current session state snapshot (do not mutate)."""
+        return self._snapshot[0]
+
+    @property
+    def system(self) -> SystemState:
+        """Current system state snapshot (do not mutate)."""
+        return self._snapshot[1]
+
     def start_session(self) -> str:
         """Begin a new swim session.
 
@@ -57,9 +100,12 @@ class StateStore:
 
             self._session_id = session_id
             self._started_at = now
-            self._stroke_rate_history = []
+            self._started_monotonic = time.monotonic()
+            self._stroke_rate_history.clear()
+            self._stroke_rate_sum = 0.0
 
-            self.session = SessionState(active=True)
+            self._snapshot = (SessionState(active=True), self._snapshot[1])
+            self._version += 1
 
             return session_id
 
@@ -82,7 +128,7 @@ class StateStore:
             # Calculate average stroke rate
             stroke_rate_avg = 0.0
             if self._stroke_rate_history:
-                stroke_rate_avg = sum(self._stroke_rate_history) / len(
+                stroke_rate_avg = self._stroke_rate_sum / len(
                     self._stroke_rate_history
                 )
 
@@ -99,8 +145,11 @@ class StateStore:
             # Reset state
             self._session_id = None
             self._started_at = None
-            self._stroke_rate_history = []
-            self.session = SessionState(active=False)
+            self._started_monotonic = None
+            self._stroke_rate_history.clear()
+            self._stroke_rate_sum = 0.0
+            self._snapshot = (SessionState(active=False), self._snapshot[1])
+            self._version += 1
 
             return summary
 
@@ -112,16 +161,24 @@ class StateStore:
             rate: Current stroke rate (strokes/min)
         """
         with self._lock:
-            self.session.stroke_count = count
-            self.session.stroke_rate = rate
-            self.session.estimated_distance_m = count * self.dps_ratio
-
-            # Track rate history for trend calculation
-            self._stroke_rate_history.append(rate)
-            if len(self._stroke_rate_history) > 10:
-                self._stroke_rate_history.pop(0)
-
-            self.session.stroke_rate_trend = self._calculate_trend()
+            # Track rate history for trend calculation; a full deque evicts
+            # its oldest sample on append
+            history = self._stroke_rate_history
+            if len(history) == history.maxlen:
+                self._stroke_rate_sum -= history[0]
+            history.append(rate)
+            self._stroke_rate_sum += rate
+
+            session, system = self._snapshot
+            session = replace(
+                session,
+                stroke_count=count,
+                stroke_rate=rate,
+                estimated_distance_m=count * self.dps_ratio,
+                stroke_rate_trend=self._calculate_trend(),
+            )
+            self._snapshot = (session, system)
+            self._version += 1
 
     def update_system(self, **kwargs: Any) -> None:
         """Update system state fields.
@@ -129,44 +186,83 @@ class StateStore:
         Args:
             **kwargs: Fields to update (is_swimming, pose_detected, voice_state)
         """
+        changes = {
+            name: kwargs[name]
+            for name in ("is_swimming", "pose_detected", "voice_state")
+            if name in kwargs
+        }
         with self._lock:
-            if "is_swimming" in kwargs:
-                self.system.is_swimming = kwargs["is_swimming"]
-            if "pose_detected" in kwargs:
-                self.system.pose_detected = kwargs["pose_detected"]
-            if "voice_state" in kwargs:
-                self.system.voice_state = kwargs["voice_state"]
-
-    def get_state_update(self) -> StateUpdate:
+            session, system = self._snapshot
+            self._snapshot = (session, replace(system, **changes))
+            self._version += 1
+
+    def get_state_update(self, into: StateUpdate | None = None) -> StateUpdate:
         """Get current state as StateUpdate message.
 
+        Args:
+            into: Existing StateUpdate to refresh in place instead of
+                allocating a new one (used by the WebSocket push loop)
+
         Returns:
             StateUpdate with current session and system state
         """
-        with self._lock:
-            # Calculate elapsed time
-            elapsed_seconds = 0
-            if self._started_at:
-                elapsed_seconds = int(
-                    (datetime.now(timezone.utc) - self._started_at).total_seconds()
-                )
-
-            session = SessionState(
-                active=self.session.active,
-                elapsed_seconds=elapsed_seconds,
-                stroke_count=self.session.stroke_count,
-                stroke_rate=self.session.stroke_rate,
-                stroke_rate_trend=self.session.stroke_rate_trend,
-                estimated_distance_m=self.session.estimated_distance_m,
-            )
-
-            system = SystemState(
-                is_swimming=self.system.is_swimming,
-                pose_detected=self.system.pose_detected,
-                voice_state=self.system.voice_state,
-            )
-
-            return StateUpdate(session=session, system=system)
+        # Lock-free: writers never mutate a published snapshot, so a single
+        # reference load gives a consistent session/system pair.
+        current, current_system = self._snapshot
+        elapsed_seconds = self.elapsed_seconds()
+        active = current.active
+        stroke_count = current.stroke_count
+        stroke_rate = current.stroke_rate
+        stroke_rate_trend = current.stroke_rate_trend
+        estimated_distance_m = current.estimated_distance_m
+        is_swimming = current_system.is_swimming
+        pose_detected = current_system.pose_detected
+        voice_state = current_system.voice_state
+
+        if into is not None:
+            session = into.session
+            session.active = active
+            session.elapsed_seconds = elapsed_seconds
+            session.stroke_count = stroke_count
+            session.stroke_rate = stroke_rate
+            session.stroke_rate_trend = stroke_rate_trend
+            session.estimated_distance_m = estimated_distance_m
+
+            system = into.system
+            system.is_swimming = is_swimming
+            system.pose_detected = pose_detected
+            system.voice_state = voice_state
+
+            into.timestamp = current_timestamp()
+            return into
+
+        session = SessionState(
+            active=active,
+            elapsed_seconds=elapsed_seconds,
+            stroke_count=stroke_count,
+            stroke_rate=stroke_rate,
+            stroke_rate_trend=stroke_rate_trend,
+            estimated_distance_m=estimated_distance_m,
+        )
+
+        system = SystemState(
+            is_swimming=is_swimming,
+            pose_detected=pose_detected,
+            voice_state=voice_state,
+        )
+
+        return StateUpdate(session=session, system=system)
+
+    def elapsed_seconds(self) -> int:
+        """Whole seconds since the session started (0 when idle).
+
+        Uses the monotonic clock, which is cheaper than building an aware
+        datetime on every push tick.
+        """
+        started = self._started_monotonic
+        if started is None:
+            return 0
+        return int(time.monotonic() - started)
 
     def _calculate_trend(self) -> str:
         """Calculate stroke rate trend from history.
@@ -174,12 +270,12 @@ class StateStore:
         Returns:
             "increasing", "decreasing", or "stable"
         """
-        if len(self._stroke_rate_history) < 4:
+        history = self._stroke_rate_history
+        if len(history) < 4:
             return "stable"
 
-        recent = self._stroke_rate_history[-4:]
-        diffs = [recent[i + 1] - recent[i] for i in range(len(recent) - 1)]
-        avg_diff = sum(diffs) / len(diffs)
+        # Mean of the last three successive differences telescopes to this
+        avg_diff = (history[-1] - history[-4]) / 3.0
 
         if avg_diff > 1.0:
             return "increasing"
@@ -199,13 +295,24 @@ class StateStore:
             vision_state: Current state from vision pipeline
         """
         with self._lock:
-            self.session.stroke_count = vision_state.stroke_count
-            self.session.stroke_rate = vision_state.stroke_rate
-            self.session.estimated_distance_m = vision_state.stroke_count * self.dps_ratio
+            session, system = self._snapshot
+            changes: dict[str, Any] = {
+                "stroke_count": vision_state.stroke_count,
+                "stroke_rate": vision_state.stroke_rate,
+                "estimated_distance_m": vision_state.stroke_count * self.dps_ratio,
+            }
 
             # Update rate history from vision for trend calculation
             if vision_state.rate_history:
-                self._stroke_rate_history = [
-                    sample.rate for sample in vision_state.rate_history[-10:]
-                ]
-                self.session.stroke_rate_trend = self._calculate_trend()
+                self._stroke_rate_history = deque(
+                    (
+                        sample.rate
+                        for sample in vision_state.rate_history[-_RATE_HISTORY_LEN:]
+                    ),
+                    maxlen=_RATE_HISTORY_LEN,
+                )
+                self._stroke_rate_sum = sum(self._stroke_rate_history)
+                changes["stroke_rate_trend"] = self._calculate_trend()
+
+            self._snapshot = (replace(session, **changes), system)
+            self._version += 1
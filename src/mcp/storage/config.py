@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationConfig:
     """Notification settings for session summaries."""
 
@@ -42,7 +42,7 @@ def _default_config_path() -> Path:
     return Path.home() / ".slipstream" / "config.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """User configuration for Slipstream."""
 
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
+def _umask_file_mode() -> int:
+    """Mode that open()/write_text() give new files: 0o666 minus the umask."""
+    # The umask can only be read by setting it, so it is probed once at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+_FILE_MODE = _umask_file_mode()
+
+
 def _default_sessions_dir() -> Path:
     """Get default sessions directory."""
     return Path.home() / ".slipstream" / "sessions"
@@ -16,9 +29,14 @@ def _default_sessions_dir() -> Path:
 
 @dataclass
 class SessionStorage:
-    """Manages session file storage."""
+    """Manages session file storage.
+
+    Sessions created through this instance are kept in memory, so updating
+    them rewrites the file without reading it back first.
+    """
 
     sessions_dir: Path = field(default_factory=_default_sessions_dir)
+    _cache: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
 
     def create_session(self, session_id: str, started_at: datetime) -> dict[str, Any]:
         """Create a new session file.
@@ -42,10 +60,10 @@ class SessionStorage:
             "estimated_distance_m": 0.0,
         }
 
-        session_path = self._session_path(session_id)
-        session_path.write_text(json.dumps(session_data, indent=2))
+        self._write(session_id, session_data)
+        self._cache[session_id] = session_data
 
-        return session_data
+        return dict(session_data)
 
     def get_session(self, session_id: str) -> dict[str, Any] | None:
         """Get session by ID.
@@ -69,13 +87,16 @@ class SessionStorage:
             session_id: Session identifier
             updates: Dict of fields to update
         """
-        session_path = self._session_path(session_id)
-        if not session_path.exists():
-            return
+        session_data = self._cache.get(session_id)
+        if session_data is None:
+            session_path = self._session_path(session_id)
+            if not session_path.exists():
+                return
+            session_data = json.loads(session_path.read_text())
+            self._cache[session_id] = session_data
 
-        session_data = json.loads(session_path.read_text())
         session_data.update(updates)
-        session_path.write_text(json.dumps(session_data, indent=2))
+        self._write(session_id, session_data)
 
     def list_sessions(self, limit: int = 10) -> list[dict[str, Any]]:
         """List sessions sorted by date (newest first).
@@ -89,15 +110,20 @@ class SessionStorage:
         if not self.sessions_dir.exists():
             return []
 
-        session_files = sorted(
-            self.sessions_dir.glob("*.json"),
-            reverse=True,
-            key=lambda p: p.stem,
-        )
+        # Session IDs are YYYY-MM-DD_HHMM, so filename order is date order and
+        # only the newest `limit` files need to be read
+        with os.scandir(self.sessions_dir) as entries:
+            session_files = [
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.name.endswith(".json")
+            ]
+        session_files.sort(reverse=True)
 
         sessions = []
-        for session_file in session_files[:limit]:
-            sessions.append(json.loads(session_file.read_text()))
+        for _, path in session_files[:limit]:
+            with open(path) as f:
+                sessions.append(json.load(f))
 
         return sessions
 
@@ -110,6 +136,8 @@ class SessionStorage:
         Returns:
             True if deleted, False if not found
         """
+        self._cache.pop(session_id, None)
+
         session_path = self._session_path(session_id)
         if not session_path.exists():
             return False
@@ -126,6 +154,24 @@ class SessionStorage:
         now = datetime.now(timezone.utc)
         return now.strftime("%Y-%m-%d_%H%M")
 
+    def _write(self, session_id: str, session_data: dict[str, Any]) -> None:
+        """Atomically replace a session file.
+
+        Args:
+            session_id: Session identifier
+            session_data: Session data dict to write
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.sessions_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(session_data, f, indent=2)
+            # mkstemp creates 0600 files; keep the usual umask-derived mode
+            os.chmod(tmp_path, _FILE_MODE)
+            os.replace(tmp_path, self._session_path(session_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def _session_path(self, session_id: str) -> Path:
         """Get file path for session.
 
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
+    from src.vision.rate_calculator import RateSample
     from src.vision.state_store import StateStore as VisionStateStore
+    from src.vision.state_store import SwimState
     from src.mcp.storage.config import Config
 
 
@@ -35,14 +37,7 @@ class MetricBridge:
                 "window_seconds": float  # rate calculation window
             }
         """
-        state = self.vision_state_store.get_state()
-        trend = self._calculate_trend(state.rate_history)
-
-        return {
-            "rate": round(state.stroke_rate, 1),
-            "trend": trend,
-            "window_seconds": self.rate_window_seconds,
-        }
+        return self._stroke_rate(self.vision_state_store.get_state())
 
     def get_stroke_count(self) -> dict:
         """
@@ -54,13 +49,7 @@ class MetricBridge:
                 "estimated_distance_m": float  # count * dps_ratio
             }
         """
-        state = self.vision_state_store.get_state()
-        distance = state.stroke_count * self.config.dps_ratio
-
-        return {
-            "count": state.stroke_count,
-            "estimated_distance_m": round(distance, 1),
-        }
+        return self._stroke_count(self.vision_state_store.get_state())
 
     def get_session_time(self) -> dict:
         """
@@ -72,8 +61,38 @@ class MetricBridge:
                 "formatted": str  # "MM:SS" format
             }
         """
+        return self._session_time(self.vision_state_store.get_state())
+
+    def get_all_metrics(self) -> dict:
+        """Get all metrics in a single call, from one state snapshot."""
         state = self.vision_state_store.get_state()
+        return {
+            "stroke_rate": self._stroke_rate(state),
+            "stroke_count": self._stroke_count(state),
+            "session_time": self._session_time(state),
+        }
 
+    def _stroke_rate(self, state: "SwimState") -> dict:
+        """Stroke rate metrics for a vision state snapshot."""
+        trend = self._calculate_trend(state.rate_history)
+
+        return {
+            "rate": round(state.stroke_rate, 1),
+            "trend": trend,
+            "window_seconds": self.rate_window_seconds,
+        }
+
+    def _stroke_count(self, state: "SwimState") -> dict:
+        """Stroke count metrics for a vision state snapshot."""
+        distance = state.stroke_count * self.config.dps_ratio
+
+        return {
+            "count": state.stroke_count,
+            "estimated_distance_m": round(distance, 1),
+        }
+
+    def _session_time(self, state: "SwimState") -> dict:
+        """Session time metrics for a vision state snapshot."""
         if not state.session_active or state.session_start is None:
             return {"elapsed_seconds": 0, "formatted": "0:00"}
 
@@ -89,15 +108,7 @@ class MetricBridge:
             "formatted": formatted,
         }
 
-    def get_all_metrics(self) -> dict:
-        """Get all metrics in a single call."""
-        return {
-            "stroke_rate": self.get_stroke_rate(),
-            "stroke_count": self.get_stroke_count(),
-            "session_time": self.get_session_time(),
-        }
-
-    def _calculate_trend(self, rate_history: list) -> str:
+    def _calculate_trend(self, rate_history: Sequence["RateSample"]) -> str:
         """
         Calculate trend from rate history.
 
@@ -107,12 +118,10 @@ class MetricBridge:
         if len(rate_history) < 2:
             return "stable"
 
-        # Take last 4 samples (or all if fewer)
-        recent = rate_history[-4:]
-        rates = [sample.rate for sample in recent]
-
-        # Simple linear trend: compare first and last
-        diff = rates[-1] - rates[0]
+        # Simple linear trend: compare first and last of the last 4 samples
+        # (or all if fewer)
+        first = rate_history[-min(4, len(rate_history))]
+        diff = rate_history[-1].rate - first.rate
 
         if diff > 2.0:
             return "increasing"
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine
 
 from src.mcp.state_store import (
@@ -37,7 +36,8 @@ def create_session_tools(
         """
         try:
             session_id = state_store.start_session()
-            started_at = datetime.now(timezone.utc)
+            # Reuse the store's timestamp so the file matches the session ID
+            started_at = state_store.started_at
 
             # Create session file
             session_storage.create_session(session_id, started_at)
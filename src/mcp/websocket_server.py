@@ -10,7 +10,9 @@ from typing import Any
 
 import websockets
 from websockets.asyncio.server import Server, ServerConnection
+from websockets.protocol import State
 
+from src.mcp.models.messages import StateUpdate
 from src.mcp.state_store import StateStore
 
 logger = logging.getLogger(__name__)
@@ -23,10 +25,19 @@ class WebSocketServer:
     state_store: StateStore
     port: int = 8765
     push_interval: float = 0.25
-    _clients: set[ServerConnection] = field(default_factory=set, repr=False)
+    heartbeat_interval: float = 5.0
+    client_queue_size: int = 2
+    _clients: dict[ServerConnection, asyncio.Queue[bytes]] = field(
+        default_factory=dict, repr=False
+    )
     _server: Server | None = field(default=None, repr=False)
     _push_task: asyncio.Task[None] | None = field(default=None, repr=False)
     _running: bool = field(default=False, repr=False)
+    # (key, payload, loop time built) of the last serialized state
+    _latest: tuple[tuple[int, int], bytes, float] | None = field(
+        default=None, repr=False
+    )
+    _scratch_update: StateUpdate = field(default_factory=StateUpdate, repr=False)
 
     async def start(self) -> None:
         """Start the WebSocket server."""
@@ -59,13 +70,15 @@ class WebSocketServer:
                 pass
             self._push_task = None
 
-        # Close all client connections
-        if self._clients:
-            await asyncio.gather(
-                *[client.close() for client in self._clients],
-                return_exceptions=True,
-            )
-            self._clients.clear()
+        # Close client connections that are still open, as "going away"
+        closing = [
+            client.close(code=1001)
+            for client in self._clients
+            if client.state is not State.CLOSED
+        ]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+        self._clients.clear()
 
         if self._server:
             self._server.close()
@@ -83,11 +96,45 @@ class WebSocketServer:
         if not self._clients:
             return
 
-        json_message = json.dumps(message)
-        await asyncio.gather(
-            *[client.send(json_message) for client in self._clients],
-            return_exceptions=True,
-        )
+        self._send_to_all(json.dumps(message).encode())
+
+    def _send_to_all(self, payload: bytes) -> None:
+        """Queue one pre-encoded JSON payload for every client.
+
+        Each client has a bounded queue drained by its own writer task, so
+        a slow client never holds up the others. When a client's queue is
+        full its oldest pending payload is dropped; state updates are
+        snapshots, so only the newest ones matter.
+
+        Args:
+            payload: UTF-8 encoded JSON, shared by all clients
+        """
+        for queue in self._clients.values():
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    @staticmethod
+    async def _drain(websocket: ServerConnection, queue: asyncio.Queue[bytes]) -> None:
+        """Send queued payloads to one client as text frames.
+
+        If sending fails for any reason other than the connection closing,
+        the error is logged and the connection closed, so _handle_client
+        removes the client instead of queueing for it forever.
+
+        Args:
+            websocket: Client WebSocket connection
+            queue: The client's pending payloads
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send(payload, text=True)
+        except websockets.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            await websocket.close(code=1011)
 
     async def _handle_client(self, websocket: ServerConnection) -> None:
         """Handle client connection.
@@ -95,13 +142,17 @@ class WebSocketServer:
         Args:
             websocket: Client WebSocket connection
         """
-        self._clients.add(websocket)
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.client_queue_size)
+        self._clients[websocket] = queue
+        writer = asyncio.create_task(self._drain(websocket, queue))
         logger.debug(f"Client connected. Total clients: {len(self._clients)}")
 
         try:
             # Send initial state
-            state_update = self.state_store.get_state_update()
-            await websocket.send(state_update.to_json())
+            store = self.state_store
+            queue.put_nowait(
+                self._state_payload((store.version, store.elapsed_seconds()))
+            )
 
             # Keep connection open
             async for message in websocket:
@@ -110,18 +161,71 @@ class WebSocketServer:
         except websockets.ConnectionClosed:
             pass
         finally:
-            self._clients.discard(websocket)
+            self._clients.pop(websocket, None)
+            writer.cancel()
             logger.debug(f"Client disconnected. Total clients: {len(self._clients)}")
 
+    def _state_payload(self, key: tuple[int, int]) -> bytes:
+        """Encoded StateUpdate for a (version, elapsed second) key.
+
+        The last payload is cached, so a burst of connecting clients and
+        the push loop share one serialization per state change. The payload
+        carries a timestamp, so it is rebuilt once it is heartbeat_interval
+        old even if the key is unchanged (e.g. no active session); heartbeat
+        pushes and new clients never get a stale timestamp.
+
+        Args:
+            key: Store version and elapsed seconds the payload must match
+
+        Returns:
+            UTF-8 encoded StateUpdate JSON
+        """
+        now = asyncio.get_running_loop().time()
+        latest = self._latest
+        if (
+            latest is not None
+            and latest[0] == key
+            and now - latest[2] < self.heartbeat_interval
+        ):
+            return latest[1]
+
+        state_update = self.state_store.get_state_update(into=self._scratch_update)
+        payload = state_update.to_json().encode()
+        self._latest = (key, payload, now)
+        return payload
+
     async def _push_loop(self) -> None:
-        """Periodically push state updates to all clients."""
+        """Periodically push state updates to all clients.
+
+        Ticks where neither the store version nor the elapsed second has
+        changed are skipped without building a message, except for a
+        heartbeat push every heartbeat_interval seconds.
+        """
+        # Bind loop invariants to locals once; the body runs every tick
+        clock = asyncio.get_running_loop().time
+        sleep = asyncio.sleep
+        interval = self.push_interval
+        heartbeat = self.heartbeat_interval
+        clients = self._clients
+        store = self.state_store
+        state_payload = self._state_payload
+        send_to_all = self._send_to_all
+        last_key: tuple[int, int] | None = None
+        last_time = 0.0
+
         while self._running:
             try:
-                await asyncio.sleep(self.push_interval)
+                await sleep(interval)
+
+                if clients:
+                    key = (store.version, store.elapsed_seconds())
+                    now = clock()
+                    if key == last_key and now - last_time < heartbeat:
+                        continue
 
-                if self._clients:
-                    state_update = self.state_store.get_state_update()
-                    await self.broadcast(json.loads(state_update.to_json()))
+                    last_key = key
+                    last_time = now
+                    send_to_all(state_payload(key))
             except asyncio.CancelledError:
                 break
             except Exception as e:
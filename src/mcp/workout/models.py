@@ -26,8 +26,10 @@ class WorkoutPhase(Enum):
 
 SegmentType = Literal["warmup", "work", "rest", "cooldown"]
 
+_VALID_SEGMENT_TYPES = frozenset(("warmup", "work", "rest", "cooldown"))
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkoutSegment:
     """
     A single segment within a workout.
@@ -56,10 +58,18 @@ class WorkoutSegment:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> WorkoutSegment:
-        """Create from dictionary."""
+        """Create from dictionary.
+
+        Raises:
+            ValueError: If the segment type is missing or unknown
+        """
+        segment_type = data.get("type")
+        if segment_type not in _VALID_SEGMENT_TYPES:
+            raise ValueError(f"Invalid segment type: {segment_type}")
+
         stroke_rate = data.get("target_stroke_rate")
         return cls(
-            type=data["type"],
+            type=segment_type,
             target_duration_seconds=data.get("target_duration_seconds"),
             target_distance_m=data.get("target_distance_m"),
             target_stroke_rate=tuple(stroke_rate) if stroke_rate else None,
@@ -72,7 +82,7 @@ def _generate_workout_id() -> str:
     return datetime.now(timezone.utc).strftime("wkt_%Y%m%d_%H%M%S")
 
 
-@dataclass
+@dataclass(slots=True)
 class Workout:
     """
     A complete workout plan with multiple segments.
@@ -116,7 +126,7 @@ class Workout:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentResult:
     """
     Result of a completed segment.
@@ -131,14 +141,21 @@ class SegmentResult:
     stroke_count: int
     avg_stroke_rate: float
     skipped: bool = False
+    _started_iso: str = field(init=False, repr=False, compare=False)
+    _ended_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Format timestamps once; results are serialized repeatedly."""
+        self._started_iso = self.started_at.isoformat()
+        self._ended_iso = self.ended_at.isoformat()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
         return {
             "segment_index": self.segment_index,
             "segment_type": self.segment_type,
-            "started_at": self.started_at.isoformat(),
-            "ended_at": self.ended_at.isoformat(),
+            "started_at": self._started_iso,
+            "ended_at": self._ended_iso,
             "actual_duration_seconds": self.actual_duration_seconds,
             "actual_distance_m": self.actual_distance_m,
             "stroke_count": self.stroke_count,
@@ -147,7 +164,7 @@ class SegmentResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutState:
     """
     Current state of an executing workout.
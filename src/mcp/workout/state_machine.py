@@ -45,13 +45,15 @@ class WorkoutNotActiveError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutStateMachine:
     """
     State machine for workout lifecycle.
 
     Manages transitions: NO_WORKOUT -> CREATED -> ACTIVE -> COMPLETE
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access: transitions and status reads hold
+    the lock, while the phase/workout/state properties are single
+    attribute loads and read without it.
     """
 
     _workout: Workout | None = field(default=None, repr=False)
@@ -62,20 +64,17 @@ class WorkoutStateMachine:
     @property
     def phase(self) -> WorkoutPhase:
         """Current workout phase."""
-        with self._lock:
-            return self._phase
+        return self._phase
 
     @property
     def workout(self) -> Workout | None:
         """Current workout."""
-        with self._lock:
-            return self._workout
+        return self._workout
 
     @property
     def state(self) -> WorkoutState | None:
         """Current workout state."""
-        with self._lock:
-            return self._state
+        return self._state
 
     def create_workout(self, workout: Workout) -> dict[str, Any]:
         """
@@ -258,47 +257,47 @@ class WorkoutStateMachine:
             if self._phase == WorkoutPhase.NO_WORKOUT:
                 return {"has_active_workout": False}
 
+            state = self._state
+            if not state:
+                return {
+                    "has_active_workout": self._phase == WorkoutPhase.ACTIVE,
+                    "phase": self._phase.value,
+                    "workout_id": self._workout.workout_id,
+                    "workout_name": self._workout.name,
+                }
+
             now = datetime.now(timezone.utc)
+            segment = state.current_segment
+            next_segment = state.next_segment
+            stroke_rate = segment.target_stroke_rate
 
-            status = {
+            return {
                 "has_active_workout": self._phase == WorkoutPhase.ACTIVE,
                 "phase": self._phase.value,
                 "workout_id": self._workout.workout_id,
                 "workout_name": self._workout.name,
+                "current_segment": {
+                    "index": state.current_segment_idx,
+                    "type": segment.type,
+                    "elapsed_seconds": int(
+                        (now - state.segment_started_at).total_seconds()
+                    ),
+                    "target_duration_seconds": segment.target_duration_seconds,
+                    "target_distance_m": segment.target_distance_m,
+                    "target_stroke_rate": list(stroke_rate) if stroke_rate else None,
+                    "notes": segment.notes,
+                },
+                "progress": {
+                    "segments_completed": len(state.segments_completed),
+                    "segments_total": len(self._workout.segments),
+                    "percent": state.progress_percent,
+                },
+                "total_elapsed_seconds": int(
+                    (now - state.total_started_at).total_seconds()
+                ),
+                "next_segment": next_segment.to_dict() if next_segment else None,
             }
 
-            if self._state:
-                segment_elapsed = int(
-                    (now - self._state.segment_started_at).total_seconds()
-                )
-                total_elapsed = int(
-                    (now - self._state.total_started_at).total_seconds()
-                )
-
-                status.update(
-                    {
-                        "current_segment": {
-                            "index": self._state.current_segment_idx,
-                            "type": self._state.current_segment.type,
-                            "elapsed_seconds": segment_elapsed,
-                            **self._state.current_segment.to_dict(),
-                        },
-                        "progress": {
-                            "segments_completed": len(self._state.segments_completed),
-                            "segments_total": len(self._workout.segments),
-                            "percent": self._state.progress_percent,
-                        },
-                        "total_elapsed_seconds": total_elapsed,
-                        "next_segment": (
-                            self._state.next_segment.to_dict()
-                            if self._state.next_segment
-                            else None
-                        ),
-                    }
-                )
-
-            return status
-
     def clear_workout(self) -> None:
         """Reset to NO_WORKOUT state."""
         with self._lock:
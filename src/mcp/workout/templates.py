@@ -6,19 +6,53 @@ Templates are stored as JSON files in the templates directory.
 
 from __future__ import annotations
 
+import glob
 import json
+import os
+import tempfile
 from dataclasses import dataclass
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, Iterator
 
 from src.mcp.workout.models import Workout
 
 
+def _umask_file_mode() -> int:
+    """Mode that open()/write_text() give new files: 0o666 minus the umask."""
+    # The umask can only be read by setting it, so it is probed once at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+_FILE_MODE = _umask_file_mode()
+
+
+# Translation table covering all of ASCII: safe characters map to themselves,
+# everything else to "_". Mapping every code point keeps str.translate on its
+# ASCII fast path.
+_ASCII_SAFE_TABLE = "".join(
+    c if c.isalnum() or c in "- _" else "_" for c in map(chr, range(128))
+)
+
+
 def _sanitize_filename(name: str) -> str:
     """Convert workout name to safe filename."""
-    safe = "".join(c if c.isalnum() or c in "- _" else "_" for c in name)
+    if name.isascii():
+        safe = name.translate(_ASCII_SAFE_TABLE)
+    else:
+        safe = "".join(c if c.isalnum() or c in "- _" else "_" for c in name)
     return safe.lower().replace(" ", "_")[:50]
 
 
+def _load_json(path: str | Path) -> Any:
+    """Read and decode a JSON file in one read, skipping text-mode decoding."""
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
 @dataclass
 class TemplateStorage:
     """
@@ -46,8 +80,18 @@ class TemplateStorage:
         filename = f"{_sanitize_filename(workout.name)}_{workout.workout_id}.json"
         path = self.template_dir / filename
 
-        with open(path, "w") as f:
-            json.dump(workout.to_dict(), f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a
+        # truncated template behind
+        fd, tmp_path = tempfile.mkstemp(dir=self.template_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(workout.to_dict(), f, indent=2)
+            # mkstemp creates 0600 files; keep the usual umask-derived mode
+            os.chmod(tmp_path, _FILE_MODE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         return path
 
@@ -61,13 +105,12 @@ class TemplateStorage:
         Returns:
             Workout if found, None otherwise
         """
-        for path in self.template_dir.glob("*.json"):
+        for path in self._candidate_paths(workout_id):
             try:
-                with open(path) as f:
-                    data = json.load(f)
+                data = _load_json(path)
                 if data.get("workout_id") == workout_id:
                     return Workout.from_dict(data)
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, KeyError, ValueError):
                 continue
         return None
 
@@ -81,20 +124,32 @@ class TemplateStorage:
         Returns:
             List of Workout templates, newest first
         """
-        templates: list[Workout] = []
+        # Sort the raw dicts by created_at, newest first, and only build
+        # Workout objects for the ones that are returned
+        entries: list[tuple[datetime, dict]] = []
+        with os.scandir(self.template_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    data = _load_json(entry.path)
+                    created_at = datetime.fromisoformat(data["created_at"])
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue
+                entries.append((created_at, data))
+
+        entries.sort(key=itemgetter(0), reverse=True)
 
-        for path in self.template_dir.glob("*.json"):
+        templates: list[Workout] = []
+        for _, data in entries:
+            if len(templates) >= limit:
+                break
             try:
-                with open(path) as f:
-                    data = json.load(f)
                 templates.append(Workout.from_dict(data))
-            except (json.JSONDecodeError, KeyError):
+            except (KeyError, ValueError):
                 continue
 
-        # Sort by created_at, newest first
-        templates.sort(key=lambda w: w.created_at, reverse=True)
-
-        return templates[:limit]
+        return templates
 
     def delete(self, workout_id: str) -> bool:
         """
@@ -106,13 +161,32 @@ class TemplateStorage:
         Returns:
             True if deleted, False if not found
         """
-        for path in self.template_dir.glob("*.json"):
+        for path in self._candidate_paths(workout_id):
             try:
-                with open(path) as f:
-                    data = json.load(f)
+                data = _load_json(path)
                 if data.get("workout_id") == workout_id:
                     path.unlink()
                     return True
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, KeyError, ValueError):
                 continue
         return False
+
+    def _candidate_paths(self, workout_id: str) -> Iterator[Path]:
+        """
+        Yield template files that may hold a workout ID.
+
+        save() names files ``{name}_{workout_id}.json``, so files with that
+        suffix are yielded first and usually end the search; the rest follow
+        for templates named otherwise.
+
+        Args:
+            workout_id: ID of workout to look for
+
+        Yields:
+            Paths to check, most likely first
+        """
+        matches = set(self.template_dir.glob(f"*_{glob.escape(workout_id)}.json"))
+        yield from matches
+        for path in self.template_dir.glob("*.json"):
+            if path not in matches:
+                yield path
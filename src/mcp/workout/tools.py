@@ -6,19 +6,35 @@ registered with the MCP server.
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable
 
 from src.mcp.workout.models import Workout, WorkoutSegment
-from src.mcp.workout.state_machine import (
-    WorkoutStateMachine,
-    WorkoutExistsError,
-    NoWorkoutError,
-    WorkoutAlreadyActiveError,
-    WorkoutNotActiveError,
-)
+from src.mcp.workout.state_machine import WorkoutStateMachine
 from src.mcp.workout.templates import TemplateStorage
 
 
+def _errors_as_dict(
+    tool: Callable[..., dict[str, Any]],
+) -> Callable[..., dict[str, Any]]:
+    """
+    Return exceptions raised by a tool as ``{"error": message}``.
+
+    State machine errors (WorkoutExistsError, NoWorkoutError, ...) carry
+    user-facing messages; anything else is reported the same way rather
+    than failing the MCP call.
+    """
+
+    @functools.wraps(tool)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        try:
+            return tool(*args, **kwargs)
+        except Exception as e:
+            return {"error": str(e)}
+
+    return wrapper
+
+
 def create_workout_tools(
     state_machine: WorkoutStateMachine,
     template_storage: TemplateStorage,
@@ -34,6 +50,7 @@ def create_workout_tools(
         List of tool functions for MCP
     """
 
+    @_errors_as_dict
     def create_workout(
         name: str,
         segments: list[dict[str, Any]],
@@ -54,27 +71,18 @@ def create_workout_tools(
             workout_id: Unique ID for this workout
             segments_count: Number of segments created
         """
-        try:
-            # Validate and convert segments
-            workout_segments = []
-            for seg in segments:
-                if seg.get("type") not in ("warmup", "work", "rest", "cooldown"):
-                    return {"error": f"Invalid segment type: {seg.get('type')}"}
-                workout_segments.append(WorkoutSegment.from_dict(seg))
+        # Validate and convert segments (invalid types raise ValueError)
+        workout_segments = [WorkoutSegment.from_dict(seg) for seg in segments]
 
-            workout = Workout(name=name, segments=workout_segments)
-            result = state_machine.create_workout(workout)
+        workout = Workout(name=name, segments=workout_segments)
+        result = state_machine.create_workout(workout)
 
-            if save_as_template:
-                template_storage.save(workout)
+        if save_as_template:
+            template_storage.save(workout)
 
-            return result
-
-        except WorkoutExistsError as e:
-            return {"error": str(e)}
-        except Exception as e:
-            return {"error": str(e)}
+        return result
 
+    @_errors_as_dict
     def start_workout() -> dict[str, Any]:
         """
         Begin executing a created workout.
@@ -87,13 +95,9 @@ def create_workout_tools(
             first_segment: Details of the first segment
             total_segments: Total number of segments
         """
-        try:
-            return state_machine.start_workout()
-        except (NoWorkoutError, WorkoutAlreadyActiveError) as e:
-            return {"error": str(e)}
-        except Exception as e:
-            return {"error": str(e)}
+        return state_machine.start_workout()
 
+    @_errors_as_dict
     def get_workout_status() -> dict[str, Any]:
         """
         Get current workout execution status.
@@ -108,11 +112,9 @@ def create_workout_tools(
             progress: Completion progress
             next_segment: Next segment preview
         """
-        try:
-            return state_machine.get_status()
-        except Exception as e:
-            return {"error": str(e)}
+        return state_machine.get_status()
 
+    @_errors_as_dict
     def skip_segment() -> dict[str, Any]:
         """
         Skip current segment and advance to next.
@@ -124,18 +126,14 @@ def create_workout_tools(
             skipped: Details of skipped segment
             now_on: Details of new current segment (or None if complete)
         """
-        try:
-            result = state_machine.skip_segment()
-            return {
-                "skipped": result.get("completed"),
-                "now_on": result.get("now_on"),
-                "workout_complete": result.get("workout_complete", False),
-            }
-        except WorkoutNotActiveError as e:
-            return {"error": str(e)}
-        except Exception as e:
-            return {"error": str(e)}
-
+        result = state_machine.skip_segment()
+        return {
+            "skipped": result.get("completed"),
+            "now_on": result.get("now_on"),
+            "workout_complete": result.get("workout_complete", False),
+        }
+
+    @_errors_as_dict
     def end_workout() -> dict[str, Any]:
         """
         End workout early.
@@ -146,15 +144,11 @@ def create_workout_tools(
         Returns:
             summary: Complete workout summary with all segment results
         """
-        try:
-            summary = state_machine.end_workout()
-            state_machine.clear_workout()
-            return {"summary": summary}
-        except WorkoutNotActiveError as e:
-            return {"error": str(e)}
-        except Exception as e:
-            return {"error": str(e)}
+        summary = state_machine.end_workout()
+        state_machine.clear_workout()
+        return {"summary": summary}
 
+    @_errors_as_dict
     def list_workout_templates(limit: int = 10) -> dict[str, Any]:
         """
         List saved workout templates.
@@ -169,14 +163,11 @@ def create_workout_tools(
             templates: List of template summaries
             count: Total number of templates
         """
-        try:
-            templates = template_storage.list(limit=limit)
-            return {
-                "templates": [t.to_dict() for t in templates],
-                "count": len(templates),
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        templates = template_storage.list(limit=limit)
+        return {
+            "templates": [t.to_dict() for t in templates],
+            "count": len(templates),
+        }
 
     return [
         create_workout,
@@ -6,9 +6,10 @@ and determines when to auto-advance segments.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from src.mcp.workout.models import WorkoutPhase
 from src.mcp.workout.state_machine import WorkoutStateMachine
@@ -57,7 +58,8 @@ class TransitionMonitor:
     grace_period_seconds: float = 5.0
     swimming_debounce_seconds: float = 2.0
     _last_swimming_state: bool = field(default=False, repr=False)
-    _swimming_state_changed_at: datetime | None = field(default=None, repr=False)
+    # time.monotonic() of the last swimming state change; 0.0 until one is seen
+    _swimming_state_changed_at: float = field(default=0.0, repr=False)
 
     def check(self) -> dict[str, Any]:
         """
@@ -74,15 +76,16 @@ class TransitionMonitor:
             return {"should_transition": False}
 
         now = datetime.now(timezone.utc)
-        segment = state.current_segment
-        segment_type = segment.type
-        rules = TRANSITION_RULES[segment_type]
 
         # Grace period check
         elapsed = (now - state.segment_started_at).total_seconds()
         if elapsed < self.grace_period_seconds:
             return {"should_transition": False, "reason": "grace_period"}
 
+        now_mono = time.monotonic()
+        segment = state.current_segment
+        trigger_checks = _COMPILED_RULES[segment.type]
+
         vision = self.vision_state_store.get_state()
 
         # Calculate current metrics
@@ -96,10 +99,13 @@ class TransitionMonitor:
             "is_swimming": vision.is_swimming,
         }
 
-        # Check each trigger
-        for trigger in rules["triggers"]:
-            should_trigger, reason = self._check_trigger(
-                trigger, segment, elapsed, segment_distance, vision.is_swimming
+        # Debounce swimming state once per tick, then check each trigger
+        # in rule order
+        is_swimming = vision.is_swimming
+        swim_stable = self._update_swim_state(is_swimming, now_mono)
+        for trigger_check in trigger_checks:
+            should_trigger, reason = trigger_check(
+                self, segment, elapsed, segment_distance, is_swimming, swim_stable
             )
             if should_trigger:
                 return {
@@ -113,62 +119,76 @@ class TransitionMonitor:
             "metrics": metrics,
         }
 
-    def _check_trigger(
+    def _check_duration(
         self,
-        trigger: str,
         segment: Any,
         elapsed: float,
         distance: float,
         is_swimming: bool,
+        swim_stable: bool,
     ) -> tuple[bool, str]:
-        """Check if specific trigger condition is met."""
-        if trigger == "duration_elapsed":
-            if segment.target_duration_seconds:
-                if elapsed >= segment.target_duration_seconds:
-                    return True, "duration_elapsed"
-
-        elif trigger == "distance_reached":
-            if segment.target_distance_m:
-                if distance >= segment.target_distance_m:
-                    return True, "distance_reached"
-
-        elif trigger == "swimming_stopped":
-            if self._is_swimming_stopped_stable(is_swimming):
-                return True, "swimming_stopped"
-
-        elif trigger == "swimming_started":
-            if self._is_swimming_started_stable(is_swimming):
-                return True, "swimming_started"
-
+        """Check if the segment's target duration has elapsed."""
+        target = segment.target_duration_seconds
+        if target and elapsed >= target:
+            return True, "duration_elapsed"
         return False, ""
 
-    def _is_swimming_stopped_stable(self, is_swimming: bool) -> bool:
-        """Check if swimmer has stably stopped (debounced)."""
-        now = datetime.now(timezone.utc)
-
-        if is_swimming != self._last_swimming_state:
-            self._last_swimming_state = is_swimming
-            self._swimming_state_changed_at = now
+    def _check_distance(
+        self,
+        segment: Any,
+        elapsed: float,
+        distance: float,
+        is_swimming: bool,
+        swim_stable: bool,
+    ) -> tuple[bool, str]:
+        """Check if the segment's target distance has been reached."""
+        target = segment.target_distance_m
+        if target and distance >= target:
+            return True, "distance_reached"
+        return False, ""
 
-        if not is_swimming and self._swimming_state_changed_at:
-            stable_time = (now - self._swimming_state_changed_at).total_seconds()
-            return stable_time >= self.swimming_debounce_seconds
+    def _check_swimming_stopped(
+        self,
+        segment: Any,
+        elapsed: float,
+        distance: float,
+        is_swimming: bool,
+        swim_stable: bool,
+    ) -> tuple[bool, str]:
+        """Check if the swimmer has stopped."""
+        if swim_stable and not is_swimming:
+            return True, "swimming_stopped"
+        return False, ""
 
-        return False
+    def _check_swimming_started(
+        self,
+        segment: Any,
+        elapsed: float,
+        distance: float,
+        is_swimming: bool,
+        swim_stable: bool,
+    ) -> tuple[bool, str]:
+        """Check if the swimmer has started."""
+        if swim_stable and is_swimming:
+            return True, "swimming_started"
+        return False, ""
 
-    def _is_swimming_started_stable(self, is_swimming: bool) -> bool:
-        """Check if swimmer has stably started (debounced)."""
-        now = datetime.now(timezone.utc)
+    def _update_swim_state(self, is_swimming: bool, now_mono: float) -> bool:
+        """
+        Track swimming state changes and report whether it is stable.
 
+        Returns:
+            True if is_swimming has held for swimming_debounce_seconds
+            since the last observed change
+        """
         if is_swimming != self._last_swimming_state:
             self._last_swimming_state = is_swimming
-            self._swimming_state_changed_at = now
-
-        if is_swimming and self._swimming_state_changed_at:
-            stable_time = (now - self._swimming_state_changed_at).total_seconds()
-            return stable_time >= self.swimming_debounce_seconds
+            self._swimming_state_changed_at = now_mono
 
-        return False
+        changed_at = self._swimming_state_changed_at
+        return bool(changed_at) and (
+            now_mono - changed_at >= self.swimming_debounce_seconds
+        )
 
     def get_metrics_for_advance(self) -> dict[str, Any]:
         """
@@ -189,3 +209,18 @@ class TransitionMonitor:
             "distance_m": round(segment_strokes * self.dps_ratio, 1),
             "avg_stroke_rate": vision.stroke_rate,
         }
+
+
+# Trigger name -> check method, and TRANSITION_RULES resolved to those
+# methods once so check() does no string dispatch per tick
+_TRIGGER_CHECKS: dict[str, Callable[..., tuple[bool, str]]] = {
+    "duration_elapsed": TransitionMonitor._check_duration,
+    "distance_reached": TransitionMonitor._check_distance,
+    "swimming_stopped": TransitionMonitor._check_swimming_stopped,
+    "swimming_started": TransitionMonitor._check_swimming_started,
+}
+
+_COMPILED_RULES: dict[str, tuple[Callable[..., tuple[bool, str]], ...]] = {
+    segment_type: tuple(_TRIGGER_CHECKS[trigger] for trigger in rules["triggers"])
+    for segment_type, rules in TRANSITION_RULES.items()
+}
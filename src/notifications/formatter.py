@@ -13,15 +13,11 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted duration string
     """
-    if seconds >= 3600:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
         return f"{hours}:{minutes:02d}:{secs:02d}"
-    else:
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
 
 
 def format_distance(meters: float) -> str:
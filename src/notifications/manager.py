@@ -53,6 +53,11 @@ class NotificationManager:
             logger.error(f"Notification error: {e}")
             return False
 
+    async def aclose(self) -> None:
+        """Release the notifier's network resources."""
+        if self.notifier is not None:
+            await self.notifier.aclose()
+
     @classmethod
     def from_config(cls, config_path: Path) -> NotificationManager:
         """
@@ -68,7 +73,7 @@ class NotificationManager:
 
         if config_path.exists():
             try:
-                config_data = json.loads(config_path.read_text())
+                config_data = json.loads(config_path.read_bytes())
                 telegram_config = config_data.get("telegram")
 
                 if telegram_config:
@@ -70,6 +70,8 @@ class TelegramNotifier:
         """
         self.config = config
         self.api_url = f"https://api.telegram.org/bot{config.bot_token}/sendMessage"
+        # Created on first send and kept so later sends reuse the connection
+        self._client: httpx.AsyncClient | None = None
 
     async def send(self, message: str) -> bool:
         """
@@ -90,13 +92,11 @@ class TelegramNotifier:
             "text": message,
         }
 
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, json=payload)
 
             if response.status_code == 200:
                 logger.info("Telegram message sent successfully")
@@ -111,3 +111,9 @@ class TelegramNotifier:
         except httpx.RequestError as e:
             logger.error(f"Telegram network error: {e}")
             return False
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
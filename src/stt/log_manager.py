@@ -3,7 +3,7 @@
 import os
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 
@@ -16,6 +16,11 @@ class LogManager:
     """
 
     log_path: Path = field(default_factory=lambda: Path.home() / ".slipstream" / "transcript.log")
+    _fd: int | None = field(default=None, init=False, repr=False)
+    _dir_ready: bool = field(default=False, init=False, repr=False)
+    _ts_sec_cached: int = field(default=-1, init=False, repr=False)
+    _ts_prefix: str = field(default="", init=False, repr=False)
+    _rotation_checked_on: date | None = field(default=None, init=False, repr=False)
 
     def append(self, text: str | None) -> None:
         """Append timestamped transcription to log file.
@@ -27,33 +32,54 @@ class LogManager:
         if text is None or not text.strip():
             return
 
-        # Ensure parent directory exists
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Format: 2026-01-11T08:30:15.123 hello world
-        timestamp = datetime.now().isoformat(timespec="milliseconds")
-        line = f"{timestamp} {text.strip()}\n"
-
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(line)
+        # Format: 2026-01-11T08:30:15.123 hello world (local time). The
+        # "YYYY-MM-DDTHH:MM:SS." prefix is formatted once per wall-clock second
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        if sec != self._ts_sec_cached:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.localtime(sec))
+            self._ts_sec_cached = sec
+        line = f"{self._ts_prefix}{ns // 1_000_000:03d} {text.strip()}\n"
+
+        # Keep the file open between appends; O_APPEND writes each line
+        # at the current end of file in a single write call
+        if self._fd is None:
+            if not self._dir_ready:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+            self._fd = os.open(
+                self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        os.write(self._fd, line.encode("utf-8"))
+
+    def close(self) -> None:
+        """Close the log file if open. A later append reopens it."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
     def rotate_if_needed(self) -> None:
         """Rotate log file if it's from a previous day.
 
         Renames the current log file with a date suffix (e.g.,
         transcript.2026-01-10.log) if the file was last modified
-        on a different day.
+        on a different day. The file is checked at most once per day,
+        so this is cheap to call on every append.
         """
-        if not self.log_path.exists():
+        today = datetime.now().date()
+        if today == self._rotation_checked_on:
             return
+        self._rotation_checked_on = today
 
         # Get file modification date
-        mtime = os.path.getmtime(self.log_path)
+        try:
+            mtime = os.stat(self.log_path).st_mtime
+        except FileNotFoundError:
+            return
         file_date = datetime.fromtimestamp(mtime).date()
-        today = datetime.now().date()
 
         if file_date < today:
-            # Rotate: rename with date suffix
+            # Rotate: rename with date suffix; the next append opens a new file
+            self.close()
             rotated_name = f"{self.log_path.stem}.{file_date.isoformat()}{self.log_path.suffix}"
             rotated_path = self.log_path.parent / rotated_name
             self.log_path.rename(rotated_path)
@@ -71,11 +97,25 @@ class LogManager:
 
         cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
 
-        for file_path in self.log_path.parent.glob("transcript.*.log"):
-            # Skip the current log file
-            if file_path == self.log_path:
-                continue
-
-            # Check modification time
-            if os.path.getmtime(file_path) < cutoff_time:
-                file_path.unlink()
+        current_name = self.log_path.name
+        prefix, suffix = "transcript.", ".log"
+        min_length = len(prefix) + len(suffix)
+
+        # Rotated logs match transcript.*.log
+        with os.scandir(self.log_path.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    len(name) < min_length
+                    or not name.startswith(prefix)
+                    or not name.endswith(suffix)
+                ):
+                    continue
+
+                # Skip the current log file
+                if name == current_name:
+                    continue
+
+                # Check modification time
+                if entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
@@ -1,13 +1,17 @@
 """Speech-to-Text service using Whisper."""
 
 import asyncio
+import logging
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Literal, Optional
 
 import numpy as np
 
 from .log_manager import LogManager
 
+logger = logging.getLogger(__name__)
+
 # Whisper expects 16kHz audio
 SAMPLE_RATE = 16000
 
@@ -36,15 +40,27 @@ class STTService:
     Supports two backends:
     - faster-whisper: CPU/CUDA, works everywhere (default)
     - whisper-trt: TensorRT optimized, Jetson/NVIDIA only (~3x faster)
+
+    With compute_type "auto", faster-whisper runs float16 on CUDA and
+    int8 on CPU. whisper-trt picks its own precision when building the
+    engine, so compute_type does not apply to it.
     """
 
     model_name: str = "small.en"
     backend: Backend = "faster-whisper"
     device: str = "auto"
+    compute_type: str = "auto"
     chunk_duration: float = 3.0
     log_manager: LogManager = field(default_factory=LogManager)
     _model: Optional[Any] = field(default=None, init=False, repr=False)
     _running: bool = field(default=False, init=False, repr=False)
+    _stream: Optional[Any] = field(default=None, init=False, repr=False)
+    # Guards opening the stream against run() aborting it from the loop
+    _stream_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    # Executor futures for captures/transcriptions still running in a thread
+    _pending: set[asyncio.Future] = field(default_factory=set, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the Whisper model."""
@@ -54,7 +70,12 @@ class STTService:
         else:
             from faster_whisper import WhisperModel
             device = self.device if self.device != "auto" else _detect_device()
-            self._model = WhisperModel(self.model_name, device=device)
+            compute_type = self.compute_type
+            if compute_type == "auto":
+                compute_type = "float16" if device == "cuda" else "int8"
+            self._model = WhisperModel(
+                self.model_name, device=device, compute_type=compute_type
+            )
 
     def transcribe(self, audio: np.ndarray) -> str:
         """Transcribe audio array to text.
@@ -90,45 +111,130 @@ class STTService:
         frames = int(self.chunk_duration * SAMPLE_RATE)
 
         # Run blocking audio recording in thread pool
-        loop = asyncio.get_event_loop()
-        audio = await loop.run_in_executor(
-            None,
-            lambda: self._record_audio(frames)
-        )
-        return audio
+        return await self._in_executor(self._record_audio, frames)
+
+    def _in_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call in the default executor, tracked until done.
+
+        The returned awaitable is shielded: cancelling the awaiting task
+        does not detach the executor future, so run() can still join the
+        worker thread before releasing the stream and log file.
+
+        Args:
+            func: Blocking callable to run in a worker thread.
+            *args: Arguments for func.
+
+        Returns:
+            Awaitable resolving to func's result.
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return asyncio.shield(future)
+
+    async def _join_pending(self) -> None:
+        """Wait for in-flight executor work, logging any failures."""
+        results = await asyncio.gather(*self._pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Audio work failed during shutdown: {result!r}")
 
     def _record_audio(self, frames: int) -> np.ndarray:
         """Synchronous audio recording.
 
+        Reads from one input stream that stays open between chunks, so
+        there is no per-chunk stream setup and no gap between chunks. No
+        stream is opened once the service is stopped.
+
         Args:
             frames: Number of audio frames to record.
 
         Returns:
-            Audio samples as numpy array.
+            Audio samples as numpy array (empty if the service stopped).
         """
-        import sounddevice as sd
+        with self._stream_lock:
+            if not self._running:
+                return np.zeros(0, dtype=np.float32)
+            if self._stream is None:
+                import sounddevice as sd
+
+                self._stream = sd.InputStream(
+                    samplerate=SAMPLE_RATE, channels=1, dtype=np.float32
+                )
+                self._stream.start()
+            stream = self._stream
 
-        audio = sd.rec(frames, samplerate=SAMPLE_RATE, channels=1, dtype=np.float32)
-        sd.wait()
+        try:
+            audio, _overflowed = stream.read(frames)
+        except Exception:
+            if self._running:
+                raise
+            # Read interrupted by _abort_stream() during shutdown
+            return np.zeros(0, dtype=np.float32)
         return audio.flatten()
 
+    def _abort_stream(self) -> None:
+        """Abort the input stream so a blocked read returns promptly."""
+        with self._stream_lock:
+            if self._stream is not None:
+                self._stream.abort()
+
+    def _close_stream(self) -> None:
+        """Close the audio input stream if open."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
     async def _process_one_chunk(self) -> None:
         """Process a single audio chunk: capture, transcribe, log."""
         audio = await self.capture_chunk()
-        text = self.transcribe(audio)
+        await self._transcribe_and_log(audio)
+
+    async def _transcribe_and_log(self, audio: np.ndarray) -> None:
+        """Transcribe a captured chunk off the event loop and log the text.
+
+        Args:
+            audio: Audio samples as numpy array (float32, 16kHz mono).
+        """
+        text = await self._in_executor(self.transcribe, audio)
         if text:
             self.log_manager.append(text)
 
     async def run(self) -> None:
-        """Main daemon loop: continuously capture, transcribe, log."""
+        """Main daemon loop: continuously capture, transcribe, log.
+
+        Capture and transcription are pipelined: the next chunk is
+        recorded while the current one is being transcribed, so speech
+        arriving during inference is not missed. Once stopped, no new
+        capture is started, and worker threads still capturing or
+        transcribing are joined before the stream and log are closed; a
+        chunk captured after stop() is discarded.
+        """
         self._running = True
+        capture: asyncio.Task | None = asyncio.create_task(self.capture_chunk())
         try:
-            while self._running:
-                await self._process_one_chunk()
+            while self._running and capture is not None:
+                audio = await capture
+                capture = None
+                if not self._running or audio.size == 0:
+                    # Stopped while capturing: discard the chunk
+                    break
+                capture = asyncio.create_task(self.capture_chunk())
+                await self._transcribe_and_log(audio)
                 # Yield to allow stop() to take effect
                 await asyncio.sleep(0)
         except asyncio.CancelledError:
             pass
+        finally:
+            self._running = False
+            if capture is not None:
+                capture.cancel()
+            # Unblock an in-flight read, and wait for its thread to leave
+            # the stream before closing it
+            self._abort_stream()
+            await self._join_pending()
+            self._close_stream()
+            self.log_manager.close()
 
     def stop(self) -> None:
         """Stop the service loop."""
@@ -1,6 +1,8 @@
 """Mock pose estimators for testing without CUDA."""
 
+import functools
 import json
+import math
 from pathlib import Path
 
 import numpy as np
@@ -13,6 +15,45 @@ from src.vision.protocols import (
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _base_pose_for(width: int, height: int) -> np.ndarray:
+    """
+    Static base pose (person swimming position) for a frame size.
+
+    Cached per frame size and returned read-only, so estimators share it.
+    """
+    keypoints = np.zeros((NUM_KEYPOINTS, 3), dtype=np.float32)
+
+    cx, cy = width // 2, height // 2
+
+    # Base positions for swimming pose (horizontal position)
+    positions = [
+        (cx, cy - 50),  # 0: nose
+        (cx - 10, cy - 60),  # 1: left_eye
+        (cx + 10, cy - 60),  # 2: right_eye
+        (cx - 20, cy - 55),  # 3: left_ear
+        (cx + 20, cy - 55),  # 4: right_ear
+        (cx - 80, cy - 30),  # 5: left_shoulder
+        (cx + 80, cy - 30),  # 6: right_shoulder
+        (cx - 120, cy),  # 7: left_elbow
+        (cx + 120, cy),  # 8: right_elbow
+        (cx - 160, cy + 30),  # 9: left_wrist
+        (cx + 160, cy + 30),  # 10: right_wrist
+        (cx - 40, cy + 80),  # 11: left_hip
+        (cx + 40, cy + 80),  # 12: right_hip
+        (cx - 50, cy + 150),  # 13: left_knee
+        (cx + 50, cy + 150),  # 14: right_knee
+        (cx - 60, cy + 220),  # 15: left_ankle
+        (cx + 60, cy + 220),  # 16: right_ankle
+    ]
+
+    for i, (x, y) in enumerate(positions):
+        keypoints[i] = [x, y, 0.95]
+
+    keypoints.setflags(write=False)
+    return keypoints
+
+
 class SineWavePoseEstimator:
     """
     Generates synthetic keypoints with sine wave motion for wrists.
@@ -34,14 +75,15 @@ class SineWavePoseEstimator:
         self.frame_size = frame_size
         self.amplitude = amplitude
         self._rng = np.random.default_rng(seed)
-        self._base_pose = self._generate_base_pose()
+        self._base_pose = _base_pose_for(*frame_size)
 
     def estimate(
         self, frame: np.ndarray, timestamp: float, frame_index: int
     ) -> PoseResult:
-        """Generate synthetic keypoints with sine wave wrist motion."""
-        keypoints = self._base_pose.copy()
-        keypoints = self._apply_stroke_motion(keypoints, timestamp)
+        """
+        Generate synthetic keypoints with sine wave wrist motion.
+        """
+        keypoints = self._apply_stroke_motion(self._base_pose.copy(), timestamp)
 
         return PoseResult(
             keypoints=keypoints,
@@ -51,39 +93,6 @@ class SineWavePoseEstimator:
             frame_index=frame_index,
         )
 
-    def _generate_base_pose(self) -> np.ndarray:
-        """Generate a static base pose (person swimming position)."""
-        keypoints = np.zeros((NUM_KEYPOINTS, 3), dtype=np.float32)
-
-        width, height = self.frame_size
-        cx, cy = width // 2, height // 2
-
-        # Base positions for swimming pose (horizontal position)
-        positions = [
-            (cx, cy - 50),  # 0: nose
-            (cx - 10, cy - 60),  # 1: left_eye
-            (cx + 10, cy - 60),  # 2: right_eye
-            (cx - 20, cy - 55),  # 3: left_ear
-            (cx + 20, cy - 55),  # 4: right_ear
-            (cx - 80, cy - 30),  # 5: left_shoulder
-            (cx + 80, cy - 30),  # 6: right_shoulder
-            (cx - 120, cy),  # 7: left_elbow
-            (cx + 120, cy),  # 8: right_elbow
-            (cx - 160, cy + 30),  # 9: left_wrist
-            (cx + 160, cy + 30),  # 10: right_wrist
-            (cx - 40, cy + 80),  # 11: left_hip
-            (cx + 40, cy + 80),  # 12: right_hip
-            (cx - 50, cy + 150),  # 13: left_knee
-            (cx + 50, cy + 150),  # 14: right_knee
-            (cx - 60, cy + 220),  # 15: left_ankle
-            (cx + 60, cy + 220),  # 16: right_ankle
-        ]
-
-        for i, (x, y) in enumerate(positions):
-            keypoints[i] = [x, y, 0.95]
-
-        return keypoints
-
     def _apply_stroke_motion(
         self, keypoints: np.ndarray, timestamp: float
     ) -> np.ndarray:
@@ -91,13 +100,14 @@ class SineWavePoseEstimator:
         # Frequency from stroke rate: f = stroke_rate / 60 Hz
         freq = self.stroke_rate / 60.0
 
-        # Left wrist (index 9) - sine wave
-        phase_left = 2 * np.pi * freq * timestamp
-        keypoints[LEFT_WRIST_IDX, 1] += self.amplitude * np.sin(phase_left)
+        # Left wrist (index 9) - sine wave. Scalar math.sin avoids numpy's
+        # per-call ufunc overhead on a single value.
+        offset = self.amplitude * math.sin(2 * math.pi * freq * timestamp)
+        keypoints[LEFT_WRIST_IDX, 1] += offset
 
-        # Right wrist (index 10) - opposite phase (alternating arms)
-        phase_right = phase_left + np.pi
-        keypoints[RIGHT_WRIST_IDX, 1] += self.amplitude * np.sin(phase_right)
+        # Right wrist (index 10) - opposite phase (alternating arms):
+        # sin(x + pi) == -sin(x)
+        keypoints[RIGHT_WRIST_IDX, 1] -= offset
 
         return keypoints
 
@@ -117,7 +127,10 @@ class FilePoseEstimator:
 
     def __init__(self, keypoints_file: Path):
         self.keypoints_file = Path(keypoints_file)
-        self._data: list[PoseResult] = []
+        # Keypoints for all frames in one (frames, NUM_KEYPOINTS, 3) array,
+        # with per-frame bbox, confidence, timestamp and frame_index alongside
+        self._keypoints = np.empty((0, NUM_KEYPOINTS, 3), dtype=np.float32)
+        self._frames: list[tuple[tuple | None, float, float, int]] = []
         self._index = 0
         self._loaded = False
 
@@ -126,22 +139,20 @@ class FilePoseEstimator:
         if self._loaded or not self.keypoints_file.exists():
             return
 
-        with open(self.keypoints_file) as f:
-            raw_data = json.load(f)
-
-        self._data = []
-        for item in raw_data:
-            keypoints = np.array(item["keypoints"], dtype=np.float32)
-            bbox = tuple(item["bbox"]) if item.get("bbox") else None
-            self._data.append(
-                PoseResult(
-                    keypoints=keypoints,
-                    bbox=bbox,
-                    confidence=item["confidence"],
-                    timestamp=item["timestamp"],
-                    frame_index=item["frame_index"],
-                )
+        raw_data = json.loads(self.keypoints_file.read_bytes())
+
+        self._keypoints = np.array(
+            [item["keypoints"] for item in raw_data], dtype=np.float32
+        ).reshape(len(raw_data), NUM_KEYPOINTS, 3)
+        self._frames = [
+            (
+                tuple(item["bbox"]) if item.get("bbox") else None,
+                item["confidence"],
+                item["timestamp"],
+                item["frame_index"],
             )
+            for item in raw_data
+        ]
         self._loaded = True
 
     def estimate(
@@ -150,12 +161,19 @@ class FilePoseEstimator:
         """Return next pre-recorded keypoints."""
         self._load_keypoints()
 
-        if self._index >= len(self._data):
+        index = self._index
+        if index >= len(self._frames):
             return None
 
-        result = self._data[self._index]
-        self._index += 1
-        return result
+        self._index = index + 1
+        bbox, confidence, recorded_timestamp, recorded_index = self._frames[index]
+        return PoseResult(
+            keypoints=self._keypoints[index],
+            bbox=bbox,
+            confidence=confidence,
+            timestamp=recorded_timestamp,
+            frame_index=recorded_index,
+        )
 
     def is_available(self) -> bool:
         """Check if keypoints file exists."""
@@ -177,29 +195,37 @@ class RandomPoseEstimator:
         self.frame_size = frame_size
         self._rng = np.random.default_rng(seed)
 
+        width, height = frame_size
+        # Columns of [0, 1) samples map to x in [0, width), y in [0, height)
+        # and confidence in [0.5, 1.0)
+        self._scale = np.array([width, height, 0.5], dtype=np.float32)
+        self._offset = np.array([0.0, 0.0, 0.5], dtype=np.float32)
+
     def estimate(
         self, frame: np.ndarray, timestamp: float, frame_index: int
     ) -> PoseResult:
-        """Generate random keypoints within frame bounds."""
+        """
+        Generate random keypoints within frame bounds.
+        """
         width, height = self.frame_size
-
-        keypoints = np.zeros((NUM_KEYPOINTS, 3), dtype=np.float32)
+        half_w, half_h = width // 2, height // 2
 
         # Generate random positions within frame
-        keypoints[:, 0] = self._rng.uniform(0, width, NUM_KEYPOINTS)
-        keypoints[:, 1] = self._rng.uniform(0, height, NUM_KEYPOINTS)
-        keypoints[:, 2] = self._rng.uniform(0.5, 1.0, NUM_KEYPOINTS)
+        keypoints = self._rng.random((NUM_KEYPOINTS, 3), dtype=np.float32)
+        np.multiply(keypoints, self._scale, out=keypoints)
+        np.add(keypoints, self._offset, out=keypoints)
 
-        # Random bounding box
-        x1 = int(self._rng.uniform(0, width // 2))
-        y1 = int(self._rng.uniform(0, height // 2))
-        x2 = int(self._rng.uniform(width // 2, width))
-        y2 = int(self._rng.uniform(height // 2, height))
+        # Random bounding box and confidence from one draw
+        r = self._rng.random(5)
+        x1 = int(r[0] * half_w)
+        y1 = int(r[1] * half_h)
+        x2 = int(half_w + r[2] * (width - half_w))
+        y2 = int(half_h + r[3] * (height - half_h))
 
         return PoseResult(
             keypoints=keypoints,
             bbox=(x1, y1, x2, y2),
-            confidence=float(self._rng.uniform(0.7, 1.0)),
+            confidence=float(0.7 + 0.3 * r[4]),
             timestamp=timestamp,
             frame_index=frame_index,
         )
@@ -1,11 +1,14 @@
 """YOLO11-Pose implementation for Jetson/CUDA."""
 
+import logging
 from pathlib import Path
 
 import numpy as np
 
 from src.vision.protocols import NUM_KEYPOINTS, PoseResult
 
+logger = logging.getLogger(__name__)
+
 
 class YoloPoseEstimator:
     """
@@ -24,6 +27,9 @@ class YoloPoseEstimator:
         model_path: Path | str = "yolo11m-pose.pt",
         conf_threshold: float = 0.5,
         device: int | str = 0,  # 0 for CUDA, "cpu" for CPU
+        warmup_runs: int = 3,
+        use_trt: bool = True,
+        max_batch_size: int = 4,
     ):
         """
         Initialize YOLO pose estimator.
@@ -32,9 +38,16 @@ class YoloPoseEstimator:
             model_path: Path to YOLO model file
             conf_threshold: Minimum confidence for detections
             device: Device to run inference on (0 for GPU, "cpu" for CPU)
+            warmup_runs: Dummy inferences run when the model is loaded
+            use_trt: On CUDA, export a .pt model to an FP16 TensorRT engine
+                (cached next to it) and run that instead
+            max_batch_size: Largest batch the exported engine accepts
         """
         self.conf_threshold = conf_threshold
         self.device = device
+        self.warmup_runs = warmup_runs
+        self.use_trt = use_trt
+        self.max_batch_size = max_batch_size
         self._model = None
         self._model_path = str(model_path)
 
@@ -43,7 +56,60 @@ class YoloPoseEstimator:
         if self._model is None:
             from ultralytics import YOLO
 
-            self._model = YOLO(self._model_path)
+            self._model = YOLO(self._resolve_model_path(), task="pose")
+
+            # The first predict calls pay for CUDA init and kernel autotuning;
+            # take that hit here rather than on the first real frame
+            dummy = np.zeros((640, 640, 3), dtype=np.uint8)
+            for _ in range(self.warmup_runs):
+                self._model.predict(
+                    source=dummy,
+                    conf=self.conf_threshold,
+                    device=self.device,
+                    verbose=False,
+                )
+
+    def _resolve_model_path(self) -> str:
+        """
+        Path of the model to load, exporting a TensorRT engine if needed.
+
+        Falls back to the original model if export is disabled, not on
+        CUDA, or fails.
+        """
+        path = Path(self._model_path)
+        if not self.use_trt or path.suffix != ".pt" or self.device == "cpu":
+            return self._model_path
+
+        engine_path = path.with_suffix(".engine")
+        if engine_path.exists():
+            return str(engine_path)
+
+        from ultralytics import YOLO
+
+        try:
+            exported = YOLO(self._model_path).export(
+                format="engine",
+                half=True,
+                device=self.device,
+                imgsz=640,
+                dynamic=True,
+                batch=self.max_batch_size,
+            )
+        except Exception as e:
+            logger.warning(f"TensorRT export failed, using {path.name}: {e}")
+            return self._model_path
+
+        logger.info(f"Exported TensorRT engine to {exported}")
+        return str(exported)
+
+    def warmup(self) -> None:
+        """
+        Load and warm up the model ahead of the first frame.
+
+        Call before starting a capture loop; otherwise this happens on
+        the first estimate call.
+        """
+        self._load_model()
 
     def estimate(
         self,
@@ -62,40 +128,76 @@ class YoloPoseEstimator:
         Returns:
             PoseResult if person detected, None otherwise
         """
+        return self.estimate_batch([frame], [timestamp], [frame_index])[0]
+
+    def estimate_batch(
+        self,
+        frames: list[np.ndarray],
+        timestamps: list[float],
+        frame_indices: list[int],
+    ) -> list[PoseResult | None]:
+        """
+        Run pose estimation on several frames in one inference call.
+
+        Args:
+            frames: BGR images as numpy arrays (H, W, 3)
+            timestamps: Timestamp of each frame in seconds
+            frame_indices: Frame number of each frame in sequence
+
+        Returns:
+            One PoseResult (or None if no person detected) per frame
+        """
         self._load_model()
 
         # Run inference
         results = self._model.predict(
-            source=frame,
+            source=list(frames),
             conf=self.conf_threshold,
             device=self.device,
             verbose=False,
         )
-        result = results[0].numpy()  # Convert tensors to numpy
 
+        return [
+            self._to_pose_result(result, timestamp, frame_index)
+            for result, timestamp, frame_index in zip(
+                results, timestamps, frame_indices
+            )
+        ]
+
+    def _to_pose_result(
+        self, result, timestamp: float, frame_index: int
+    ) -> PoseResult | None:
+        """
+        Extract the best detection from one frame's YOLO result.
+
+        The result's tensors stay on the inference device: the best detection
+        is picked there and only its keypoints, box and score are copied to
+        the host, rather than converting every tensor with result.numpy().
+        """
         # No detection
         if result.keypoints is None or len(result.keypoints.xy) == 0:
             return None
 
         # Multi-person: select highest confidence detection
-        if len(result.boxes.conf) > 1:
-            best_idx = int(np.argmax(result.boxes.conf))
+        conf = result.boxes.conf
+        if len(conf) > 1:
+            best_idx = int(conf.argmax())
         else:
             best_idx = 0
 
         # Extract keypoints: shape (17, 3) with [x, y, conf]
-        keypoints = result.keypoints.data[best_idx]  # (17, 3)
+        keypoints = result.keypoints.data[best_idx].cpu().numpy()  # (17, 3)
 
         # Validate keypoint shape
         if keypoints.shape[0] != NUM_KEYPOINTS:
             return None
 
         # Extract bounding box
-        bbox_xyxy = result.boxes.xyxy[best_idx]  # (4,)
+        bbox_xyxy = result.boxes.xyxy[best_idx].cpu().numpy()  # (4,)
         bbox = tuple(int(v) for v in bbox_xyxy)  # (x1, y1, x2, y2)
 
         # Overall detection confidence
-        confidence = float(result.boxes.conf[best_idx])
+        confidence = float(conf[best_idx])
 
         return PoseResult(
             keypoints=keypoints,  # np.ndarray shape (17, 3)
@@ -1,7 +1,5 @@
 """Keypoint buffer for storing recent pose history."""
 
-from collections import deque
-
 import numpy as np
 
 from src.vision.protocols import LEFT_WRIST_IDX, PoseResult, RIGHT_WRIST_IDX
@@ -15,7 +13,7 @@ class KeypointBuffer:
     Default size: 300 frames (~10 seconds at 30 FPS)
 
     Handles occlusion via confidence filtering—low confidence
-    keypoints are skipped (None stored), and downstream
+    keypoints are marked invalid and skipped, and downstream
     algorithms handle gaps gracefully.
     """
 
@@ -29,31 +27,53 @@ class KeypointBuffer:
         """
         self.max_size = max_size
         self.min_confidence = min_confidence
-        self._left_wrist_y: deque[float | None] = deque(maxlen=max_size)
-        self._right_wrist_y: deque[float | None] = deque(maxlen=max_size)
-        self._timestamps: deque[float] = deque(maxlen=max_size)
+
+        # Ring buffers of wrist Y, validity (confident, not occluded) and
+        # timestamps. Each slot is written twice, at i and i + max_size, so
+        # the window in order is always one contiguous slice.
+        self._left_wrist_y = np.zeros(2 * max_size, dtype=np.float32)
+        self._right_wrist_y = np.zeros(2 * max_size, dtype=np.float32)
+        self._left_valid = np.zeros(2 * max_size, dtype=bool)
+        self._right_valid = np.zeros(2 * max_size, dtype=bool)
+        self._timestamps = np.zeros(2 * max_size, dtype=np.float32)
+        self._next = 0  # Slot the next frame is written to
+        self._count = 0
 
     def add(self, pose: PoseResult) -> None:
         """
         Add a pose result to the buffer.
 
-        Low-confidence wrists are stored as None.
+        Low-confidence wrists are marked invalid (occluded).
         """
-        self._timestamps.append(pose.timestamp)
+        i = self._next
+        mirror = i + self.max_size
+        keypoints = pose.keypoints
+        min_confidence = self.min_confidence
+
+        self._timestamps[i] = self._timestamps[mirror] = pose.timestamp
+
+        # Left wrist - check confidence before marking valid
+        left_kp = keypoints[LEFT_WRIST_IDX]
+        self._left_wrist_y[i] = self._left_wrist_y[mirror] = left_kp[1]
+        self._left_valid[i] = self._left_valid[mirror] = (
+            left_kp[2] >= min_confidence
+        )
 
-        # Left wrist - check confidence before storing
-        left_kp = pose.keypoints[LEFT_WRIST_IDX]
-        if left_kp[2] >= self.min_confidence:
-            self._left_wrist_y.append(float(left_kp[1]))
-        else:
-            self._left_wrist_y.append(None)  # Occluded
+        # Right wrist - check confidence before marking valid
+        right_kp = keypoints[RIGHT_WRIST_IDX]
+        self._right_wrist_y[i] = self._right_wrist_y[mirror] = right_kp[1]
+        self._right_valid[i] = self._right_valid[mirror] = (
+            right_kp[2] >= min_confidence
+        )
 
-        # Right wrist - check confidence before storing
-        right_kp = pose.keypoints[RIGHT_WRIST_IDX]
-        if right_kp[2] >= self.min_confidence:
-            self._right_wrist_y.append(float(right_kp[1]))
-        else:
-            self._right_wrist_y.append(None)  # Occluded
+        self._next = (i + 1) % self.max_size
+        if self._count < self.max_size:
+            self._count += 1
+
+    def _window(self) -> slice:
+        """Slice of the mirrored buffers holding frames oldest to newest."""
+        start = (self._next - self._count) % self.max_size
+        return slice(start, start + self._count)
 
     def get_wrist_trajectory(
         self, wrist: str = "left"
@@ -70,27 +90,25 @@ class KeypointBuffer:
         Returns:
             Tuple of (positions, timestamps) arrays
         """
-        data = self._left_wrist_y if wrist == "left" else self._right_wrist_y
-
-        # Filter out None values (occluded frames)
-        valid_indices = [i for i, v in enumerate(data) if v is not None]
-        positions = np.array([data[i] for i in valid_indices], dtype=np.float32)
-        timestamps = np.array(
-            [self._timestamps[i] for i in valid_indices], dtype=np.float32
-        )
+        if wrist == "left":
+            positions, valid = self._left_wrist_y, self._left_valid
+        else:
+            positions, valid = self._right_wrist_y, self._right_valid
 
-        return positions, timestamps
+        # Filter out occluded frames
+        window = self._window()
+        mask = valid[window]
+        return positions[window][mask], self._timestamps[window][mask]
 
     def get_timestamps(self) -> np.ndarray:
         """Get all timestamps (including occluded frames)."""
-        return np.array(self._timestamps, dtype=np.float32)
+        return self._timestamps[self._window()].copy()
 
     def clear(self) -> None:
         """Clear all buffered data."""
-        self._left_wrist_y.clear()
-        self._right_wrist_y.clear()
-        self._timestamps.clear()
+        self._next = 0
+        self._count = 0
 
     def __len__(self) -> int:
         """Number of frames in buffer (including occluded)."""
-        return len(self._timestamps)
+        return self._count
@@ -1,14 +1,24 @@
 """Main vision processing pipeline."""
 
+import queue
+import threading
 from datetime import datetime
+from typing import Callable
 
 import numpy as np
 
 from src.vision.keypoint_buffer import KeypointBuffer
-from src.vision.protocols import PoseEstimatorProtocol, VideoSourceProtocol
+from src.vision.protocols import (
+    PoseEstimatorProtocol,
+    PoseResult,
+    VideoSourceProtocol,
+)
 from src.vision.rate_calculator import RateCalculator
 from src.vision.state_store import StateStore
-from src.vision.stroke_detector import StrokeDetector
+from src.vision.stroke_detector import StrokeDetector, StrokeEvent
+
+# Queued by the capture thread after the last frame
+_END_OF_STREAM = object()
 
 
 class VisionPipeline:
@@ -25,6 +35,7 @@ class VisionPipeline:
         buffer_size: int = 300,
         rate_window: float = 15.0,
         confidence_threshold: float = 0.5,
+        batch_size: int = 4,
     ):
         """
         Initialize the vision pipeline.
@@ -35,6 +46,8 @@ class VisionPipeline:
             buffer_size: Number of frames to buffer for analysis
             rate_window: Time window for rate calculation (seconds)
             confidence_threshold: Minimum confidence for valid keypoints
+            batch_size: Frames per inference call in run(), for estimators
+                that provide estimate_batch
         """
         self.pose_estimator = pose_estimator
         self.state_store = state_store
@@ -44,9 +57,13 @@ class VisionPipeline:
         )
         self.stroke_detector = StrokeDetector()
         self.rate_calculator = RateCalculator(window_seconds=rate_window)
+        self.batch_size = batch_size
 
         # Track the timestamp of last processed stroke to avoid duplicates
         self._last_stroke_timestamp: float = -1.0
+        # Incremental detection: scan at most once per min_peak_distance of
+        # new samples (see _detect_new_strokes)
+        self._last_detect_time: float = float("-inf")
 
     def process_frame(
         self, frame: np.ndarray, timestamp: float, frame_index: int
@@ -61,7 +78,16 @@ class VisionPipeline:
         """
         # 1. Estimate pose
         pose = self.pose_estimator.estimate(frame, timestamp, frame_index)
+        self._analyze(pose, timestamp)
+
+    def _analyze(self, pose: PoseResult | None, timestamp: float) -> None:
+        """
+        Run stroke detection and state updates for one estimated frame.
 
+        Args:
+            pose: Pose estimate for the frame, or None if no detection
+            timestamp: Frame timestamp in seconds
+        """
         # 2. Update buffer and detect strokes
         new_strokes = []
         if pose is not None:
@@ -69,14 +95,7 @@ class VisionPipeline:
 
             # 3. Detect strokes from trajectory (pre-filtered for confident keypoints)
             if len(self.buffer) > 10:  # Need enough data
-                wrist_y, wrist_timestamps = self.buffer.get_wrist_trajectory("left")
-                strokes = self.stroke_detector.detect_strokes(wrist_y, wrist_timestamps)
-
-                # Only add strokes we haven't seen yet (by timestamp)
-                for stroke in strokes:
-                    if stroke.timestamp > self._last_stroke_timestamp:
-                        new_strokes.append(stroke)
-                        self._last_stroke_timestamp = stroke.timestamp
+                new_strokes = self._detect_new_strokes()
 
         # 4. Update rate calculator with new strokes
         for stroke in new_strokes:
@@ -95,21 +114,160 @@ class VisionPipeline:
             is_swimming=pose is not None and rate > 0,
         )
 
-    def run(self, video_source: VideoSourceProtocol) -> None:
+    def _detect_new_strokes(self) -> list[StrokeEvent]:
+        """
+        Detect strokes in the tail of the left wrist trajectory.
+
+        Rather than rescanning the whole buffer every frame, detection runs
+        once at least min_peak_distance seconds of new samples have arrived,
+        on the samples from the last reported stroke (less a lookback of
+        four min_peak_distance spans) onwards. Anchoring on the last stroke
+        rather than a fixed span keeps the trough before the next peak in
+        the window whatever the stroke period, so slow strokes reach the
+        detector's prominence as they would on the full buffer. Before the
+        first stroke, or after a long pause, the window is the whole buffer.
+
+        Returns:
+            Strokes newer than the last stroke already reported
+        """
+        wrist_y, wrist_timestamps = self.buffer.get_wrist_trajectory("left")
+        if len(wrist_timestamps) == 0:
+            return []
+
+        min_peak_distance = self.stroke_detector.min_peak_distance
+        newest = float(wrist_timestamps[-1])
+        if newest - self._last_detect_time < min_peak_distance:
+            return []
+
+        window_start = self._last_stroke_timestamp - 4 * min_peak_distance
+        start = int(np.searchsorted(wrist_timestamps, window_start))
+        strokes = self.stroke_detector.detect_strokes(
+            wrist_y[start:], wrist_timestamps[start:]
+        )
+        self._last_detect_time = newest
+
+        # Only add strokes we haven't seen yet (by timestamp)
+        new_strokes = []
+        for stroke in strokes:
+            if stroke.timestamp > self._last_stroke_timestamp:
+                new_strokes.append(stroke)
+                self._last_stroke_timestamp = stroke.timestamp
+        return new_strokes
+
+    def run(
+        self, video_source: VideoSourceProtocol, drop_frames: bool = False
+    ) -> None:
         """
         Run pipeline on video source until exhausted.
 
+        Frames are read on a background capture thread into a small
+        bounded queue, so decoding/acquisition continues while the pose
+        estimator runs on the calling thread.
+
         Args:
             video_source: Video source to process
+            drop_frames: For live sources, drop the oldest queued frame
+                instead of waiting when inference falls behind
         """
+        # Load/warm up the model before the first frame, if supported
+        warmup = getattr(self.pose_estimator, "warmup", None)
+        if warmup is not None:
+            warmup()
+
+        estimate_batch = getattr(self.pose_estimator, "estimate_batch", None)
+        if self.batch_size <= 1:
+            estimate_batch = None
+
+        frames: queue.Queue = queue.Queue(maxsize=max(2, self.batch_size))
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        capture = threading.Thread(
+            target=self._capture,
+            args=(video_source, frames, stop, drop_frames, errors),
+            name="vision-capture",
+            daemon=True,
+        )
+        capture.start()
+
         try:
-            for frame, timestamp, frame_index in video_source.frames():
-                self.process_frame(frame, timestamp, frame_index)
+            # Batch frames into one inference call, then analyze in order
+            batch: list[tuple[np.ndarray, float, int]] = []
+            while (item := frames.get()) is not _END_OF_STREAM:
+                if estimate_batch is None:
+                    self.process_frame(*item)
+                    continue
+                batch.append(item)
+                if len(batch) == self.batch_size:
+                    self._process_batch(estimate_batch, batch)
+                    batch = []
+            if batch:
+                self._process_batch(estimate_batch, batch)
         finally:
+            stop.set()
+            capture.join()
             video_source.close()
 
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _capture(
+        video_source: VideoSourceProtocol,
+        frames: queue.Queue,
+        stop: threading.Event,
+        drop_frames: bool,
+        errors: list[BaseException],
+    ) -> None:
+        """Capture thread: feed source frames into the queue, then end-of-stream."""
+
+        def put(item: object) -> None:
+            while not stop.is_set():
+                if drop_frames:
+                    try:
+                        frames.put_nowait(item)
+                        return
+                    except queue.Full:
+                        try:
+                            frames.get_nowait()
+                        except queue.Empty:
+                            pass
+                else:
+                    try:
+                        frames.put(item, timeout=0.1)
+                        return
+                    except queue.Full:
+                        pass
+
+        try:
+            for item in video_source.frames():
+                if stop.is_set():
+                    break
+                put(item)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            # Blocking put: the end marker must never be dropped
+            while not stop.is_set():
+                try:
+                    frames.put(_END_OF_STREAM, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    def _process_batch(
+        self,
+        estimate_batch: Callable[..., list[PoseResult | None]],
+        batch: list[tuple[np.ndarray, float, int]],
+    ) -> None:
+        """Estimate poses for a batch of frames and analyze each in order."""
+        frames, timestamps, frame_indices = zip(*batch)
+        poses = estimate_batch(list(frames), list(timestamps), list(frame_indices))
+        for pose, timestamp in zip(poses, timestamps):
+            self._analyze(pose, timestamp)
+
     def reset(self) -> None:
         """Reset pipeline state for a new session."""
         self.buffer.clear()
         self.rate_calculator.reset()
         self._last_stroke_timestamp = -1.0
+        self._last_detect_time = float("-inf")
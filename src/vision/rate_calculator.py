@@ -35,21 +35,26 @@ class RateCalculator:
             sample_interval: How often to record rate samples
         """
         self.window_seconds = window_seconds
-        self._stroke_times: list[float] = []
+        # Stroke times within the window of the latest get_rate call; older
+        # strokes are pruned from the left, so only the total is kept
+        self._stroke_times: deque[float] = deque()
+        self._total_strokes = 0
         self._rate_history: deque[RateSample] = deque(maxlen=history_max_samples)
         self._last_sample_time: float = -sample_interval  # Allow immediate first sample
         self._sample_interval = sample_interval
 
     def add_stroke(self, timestamp: float) -> None:
-        """Record a stroke event."""
+        """Record a stroke event (timestamps are expected in order)."""
         self._stroke_times.append(timestamp)
+        self._total_strokes += 1
 
     def get_rate(self, current_time: float) -> float:
         """
         Calculate current stroke rate in strokes/minute.
 
-        Only considers strokes within the rolling window.
-        Also records to rate_history at sample_interval.
+        Only considers strokes within the rolling window; strokes older
+        than the window are discarded, so current_time should not decrease
+        between calls. Also records to rate_history at sample_interval.
 
         Args:
             current_time: Current timestamp for window calculation
@@ -57,9 +62,11 @@ class RateCalculator:
         Returns:
             Stroke rate in strokes per minute
         """
-        # Get strokes within window
+        # Drop strokes that have left the window
         window_start = current_time - self.window_seconds
-        strokes_in_window = [t for t in self._stroke_times if t >= window_start]
+        strokes_in_window = self._stroke_times
+        while strokes_in_window and strokes_in_window[0] < window_start:
+            strokes_in_window.popleft()
 
         # Need at least 2 strokes to calculate rate
         if len(strokes_in_window) < 2:
@@ -101,10 +108,11 @@ class RateCalculator:
 
     def get_stroke_count(self) -> int:
         """Total strokes recorded in session."""
-        return len(self._stroke_times)
+        return self._total_strokes
 
     def reset(self) -> None:
         """Clear all stroke history and rate samples."""
         self._stroke_times.clear()
+        self._total_strokes = 0
         self._rate_history.clear()
         self._last_sample_time = -self._sample_interval
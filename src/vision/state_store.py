@@ -3,7 +3,7 @@
 import threading
 from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 if TYPE_CHECKING:
     from src.vision.rate_calculator import RateSample
@@ -17,7 +17,7 @@ class SwimState:
     session_start: datetime | None = None
     stroke_count: int = 0
     stroke_rate: float = 0.0
-    rate_history: list["RateSample"] = field(default_factory=list)  # For trend analysis
+    rate_history: Sequence["RateSample"] = field(default_factory=list)  # For trend analysis
     last_stroke_time: datetime | None = None
     pose_detected: bool = False
     is_swimming: bool = False
@@ -25,6 +25,13 @@ class SwimState:
     # Note: No trend field - Claude derives trends from rate_history
 
 
+def _shallow_copy(state: SwimState) -> SwimState:
+    """Field-for-field copy of a state, without re-running __init__."""
+    snapshot = SwimState.__new__(SwimState)
+    snapshot.__dict__.update(state.__dict__)
+    return snapshot
+
+
 class StateStore:
     """
     Thread-safe state container for swim session data.
@@ -33,30 +40,38 @@ class StateStore:
     - Vision pipeline (writes state)
     - MCP server (reads state)
     - WebSocket publisher (reads state)
+
+    Writers build a new SwimState and swap it in under the lock; the
+    current state object is never mutated afterwards. Reads therefore take
+    no lock: loading the self._state reference is atomic under CPython's
+    GIL, so a reader always sees one complete state.
     """
 
     def __init__(self) -> None:
         """Initialize state store with default state."""
-        self._state = SwimState()
+        # rate_history is held as a tuple, so snapshots can share it
+        self._state = SwimState(rate_history=())
         self._lock = threading.RLock()
 
     def get_state(self) -> SwimState:
         """
         Get a snapshot of current state.
 
-        Returns a copy to prevent external modification.
+        Returns a copy to prevent external modification; rate_history is
+        an immutable tuple shared with the store rather than copied.
         """
-        with self._lock:
-            # Create a copy with a new list for rate_history
-            return replace(self._state, rate_history=list(self._state.rate_history))
+        return _shallow_copy(self._state)
 
     def update(self, **kwargs: Any) -> None:
         """
         Update state fields atomically.
 
         Args:
-            **kwargs: Fields to update (e.g., stroke_count=10)
+            **kwargs: Fields to update (e.g., stroke_count=10). rate_history
+                is stored as a tuple.
         """
+        if "rate_history" in kwargs:
+            kwargs["rate_history"] = tuple(kwargs["rate_history"])
         with self._lock:
             self._state = replace(self._state, **kwargs)
 
@@ -68,7 +83,7 @@ class StateStore:
                 session_start=datetime.now(),
                 stroke_count=0,
                 stroke_rate=0.0,
-                rate_history=[],
+                rate_history=(),
                 last_stroke_time=None,
                 pose_detected=False,
                 is_swimming=False,
@@ -84,9 +99,9 @@ class StateStore:
         with self._lock:
             # Mark session as ended and capture final state
             self._state = replace(self._state, session_active=False)
-            final_state = replace(self._state, rate_history=list(self._state.rate_history))
+            final_state = _shallow_copy(self._state)
 
             # Reset to default
-            self._state = SwimState()
+            self._state = SwimState(rate_history=())
 
             return final_state
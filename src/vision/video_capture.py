@@ -1,10 +1,21 @@
 """Video capture sources for the vision pipeline."""
 
+import logging
 from pathlib import Path
 from typing import Iterator
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+# GStreamer pipeline decoding H.264 MP4 on the Jetson hardware decoder
+# (NVDEC via nvv4l2decoder), converted to BGR frames for OpenCV
+_JETSON_DECODE_PIPELINE = (
+    'filesrc location="{path}" ! qtdemux ! h264parse ! nvv4l2decoder'
+    " ! nvvidconv ! video/x-raw, format=BGRx"
+    " ! videoconvert ! video/x-raw, format=BGR ! appsink"
+)
+
 
 class MockVideoSource:
     """
@@ -39,13 +50,18 @@ class MockVideoSource:
         """
         Yield synthetic frames.
 
+        Every frame is the same read-only array, allocated once per call;
+        the content never changes, so consumers that need to draw on a
+        frame must copy it.
+
         Yields:
             Tuple of (frame, timestamp, frame_index)
         """
         width, height = self.frame_size
+        frame = np.full((height, width, 3), self.frame_color, dtype=np.uint8)
+        frame.setflags(write=False)
         for i in range(self.total_frames):
             timestamp = i / self._fps
-            frame = np.full((height, width, 3), self.frame_color, dtype=np.uint8)
             yield frame, timestamp, i
 
     @property
@@ -66,12 +82,15 @@ class FileVideoSource:
     Requires OpenCV (cv2) to be installed.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, hw_decode: bool = False):
         """
         Initialize file video source.
 
         Args:
             path: Path to video file
+            hw_decode: Decode H.264 on the Jetson hardware decoder through
+                OpenCV's GStreamer backend, leaving the CPU free. Falls back
+                to OpenCV's default (CPU) decoder if the pipeline can't open
 
         Raises:
             FileNotFoundError: If video file doesn't exist
@@ -83,7 +102,21 @@ class FileVideoSource:
         # Lazy import cv2 to avoid dependency if not needed
         import cv2
 
-        self._cap = cv2.VideoCapture(str(self.path))
+        self._cap = None
+        if hw_decode:
+            self._cap = cv2.VideoCapture(
+                _JETSON_DECODE_PIPELINE.format(path=self.path), cv2.CAP_GSTREAMER
+            )
+            if not self._cap.isOpened():
+                logger.warning(
+                    f"Hardware decode unavailable for {self.path.name}, "
+                    "using CPU decoding"
+                )
+                self._cap.release()
+                self._cap = None
+
+        if self._cap is None:
+            self._cap = cv2.VideoCapture(str(self.path))
         if not self._cap.isOpened():
             raise IOError(f"Could not open video file: {path}")
 
@@ -93,6 +126,10 @@ class FileVideoSource:
         """
         Yield frames from video file.
 
+        Each frame is read and decoded on the calling thread.
+        VisionPipeline.run iterates this on its capture thread, which
+        already overlaps decoding with inference.
+
         Yields:
             Tuple of (frame, timestamp, frame_index)
         """
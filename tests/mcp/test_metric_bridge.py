@@ -236,3 +236,4 @@ class TestMetricBridgeEdgeCases:
         assert result["stroke_rate"]["rate"] == 55.0
         assert result["stroke_count"]["count"] == 200
         assert result["session_time"]["formatted"] == "10:00"
+        mock_vision_state_store.get_state.assert_called_once()
@@ -103,6 +103,14 @@ class TestStateUpdate:
         assert parsed["session"]["stroke_count"] == 42
         assert parsed["system"]["is_swimming"] is True
 
+    def test_state_update_to_json_compact(self) -> None:
+        """StateUpdate JSON has no insignificant whitespace."""
+        json_str = StateUpdate().to_json()
+
+        assert ", " not in json_str
+        assert ": " not in json_str
+        assert json.loads(json_str)["type"] == "state_update"
+
     def test_state_update_from_dict(self) -> None:
         """StateUpdate creates from dict correctly."""
         data = {
@@ -140,6 +148,14 @@ class TestStateUpdate:
         assert update.session.active is False
         assert update.system.is_swimming is False
 
+    @freeze_time("2026-01-14T08:30:00.250000Z")
+    def test_state_update_timestamp_fractional_seconds(self) -> None:
+        """StateUpdate timestamp matches datetime.isoformat() output."""
+        update = StateUpdate()
+
+        assert update.timestamp == "2026-01-14T08:30:00.250000+00:00"
+        assert update.timestamp == datetime.now(timezone.utc).isoformat()
+
     def test_state_update_timestamp_format(self) -> None:
         """StateUpdate timestamp is ISO format."""
         update = StateUpdate()
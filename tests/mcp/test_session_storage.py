@@ -36,6 +36,15 @@ class TestSessionStorage:
         session_path = storage.sessions_dir / f"{session_id}.json"
         assert session_path.exists()
 
+    def test_session_file_mode_follows_umask(self, storage: SessionStorage) -> None:
+        """Session files get the same mode as a plainly written file."""
+        storage.create_session("2026-01-14_0830", datetime.now(timezone.utc))
+        reference = storage.sessions_dir / "reference.txt"
+        reference.write_text("")
+
+        session_path = storage.sessions_dir / "2026-01-14_0830.json"
+        assert session_path.stat().st_mode == reference.stat().st_mode
+
     def test_get_session(self, storage: SessionStorage) -> None:
         """Get existing session by ID."""
         session_id = "2026-01-14_0830"
@@ -74,6 +83,18 @@ class TestSessionStorage:
         assert updated["stroke_rate_avg"] == 52.5
         assert updated["started_at"] == "2026-01-14T08:30:00+00:00"
 
+    def test_update_created_session(self, storage: SessionStorage) -> None:
+        """Update a session created by this storage instance."""
+        session_id = "2026-01-14_0830"
+        storage.create_session(session_id, datetime.now(timezone.utc))
+
+        storage.update_session(session_id, {"stroke_count": 42})
+
+        assert storage.get_session(session_id)["stroke_count"] == 42
+        assert [p.name for p in storage.sessions_dir.iterdir()] == [
+            f"{session_id}.json"
+        ]
+
     def test_list_sessions(self, storage: SessionStorage) -> None:
         """List sessions sorted by date (newest first)."""
         # Create several session files
@@ -42,6 +42,17 @@ class TestSessionTools:
         assert result["started_at"] == "2026-01-14T08:30:00+00:00"
         assert state_store.session.active is True
 
+    @freeze_time("2026-01-14T08:30:59Z", auto_tick_seconds=1)
+    def test_start_session_uses_store_timestamp(
+        self, tools: dict, state_store: StateStore, storage: SessionStorage
+    ) -> None:
+        """The session file records the same start time as the store."""
+        result = tools["start_session"]()
+
+        assert result["started_at"] == state_store.started_at.isoformat()
+        session = storage.get_session(result["session_id"])
+        assert session["started_at"] == result["started_at"]
+
     def test_start_session_already_active(
         self, tools: dict, state_store: StateStore
     ) -> None:
@@ -92,6 +92,52 @@ class TestStateStore:
         assert update.session.stroke_count == 10
         assert update.system.is_swimming is True
 
+    def test_get_state_update_into_existing(self, store: StateStore) -> None:
+        """Refresh an existing StateUpdate in place."""
+        scratch = StateUpdate()
+        store.start_session()
+        store.update_strokes(count=10, rate=50.0)
+        store.update_system(voice_state="listening")
+
+        update = store.get_state_update(into=scratch)
+
+        assert update is scratch
+        assert update.session.active is True
+        assert update.session.stroke_count == 10
+        assert update.system.voice_state == "listening"
+
+        store.update_strokes(count=12, rate=51.0)
+        assert store.get_state_update(into=scratch).session.stroke_count == 12
+
+    def test_writers_publish_new_snapshot(self, store: StateStore) -> None:
+        """Writers replace the snapshot rather than mutating it."""
+        store.start_session()
+        session, system = store.session, store.system
+
+        store.update_strokes(count=5, rate=40.0)
+        store.update_system(is_swimming=True)
+
+        assert session.stroke_count == 0
+        assert system.is_swimming is False
+        assert store.session.stroke_count == 5
+        assert store.system.is_swimming is True
+
+    def test_version_bumped_by_writers(self, store: StateStore) -> None:
+        """Every write advances the version counter."""
+        versions = [store.version]
+        store.start_session()
+        versions.append(store.version)
+        store.update_strokes(count=1, rate=40.0)
+        versions.append(store.version)
+        store.update_system(voice_state="listening")
+        versions.append(store.version)
+        store.end_session()
+        versions.append(store.version)
+
+        assert versions == sorted(set(versions))
+        store.get_state_update()
+        assert store.version == versions[-1]
+
     def test_stroke_rate_trend_increasing(self, store: StateStore) -> None:
         """Detect increasing stroke rate trend."""
         store.start_session()
@@ -6,6 +6,7 @@ import json
 import pytest
 import pytest_asyncio
 import websockets
+from websockets.protocol import State
 
 from src.mcp.state_store import StateStore
 from src.mcp.websocket_server import WebSocketServer
@@ -79,6 +80,21 @@ class TestWebSocketServer:
         for ws in clients:
             await ws.close()
 
+    @pytest.mark.asyncio
+    async def test_connecting_clients_share_initial_payload(
+        self, server: WebSocketServer, state_store: StateStore
+    ) -> None:
+        """Clients connecting to unchanged state reuse one serialized frame."""
+        async with websockets.connect(f"ws://localhost:{server.port}") as first:
+            initial = await asyncio.wait_for(first.recv(), timeout=1.0)
+            async with websockets.connect(f"ws://localhost:{server.port}") as second:
+                assert await asyncio.wait_for(second.recv(), timeout=1.0) == initial
+
+            state_store.update_system(voice_state="listening")
+            async with websockets.connect(f"ws://localhost:{server.port}") as third:
+                data = json.loads(await asyncio.wait_for(third.recv(), timeout=1.0))
+                assert data["system"]["voice_state"] == "listening"
+
     @pytest.mark.asyncio
     async def test_client_disconnect(self, server: WebSocketServer) -> None:
         """Client disconnect handled gracefully."""
@@ -112,6 +128,15 @@ class TestWebSocketServer:
         ws_server = WebSocketServer(state_store, port=0, push_interval=0.1)
         await ws_server.start()
 
+        async def change_state() -> None:
+            count = 0
+            while True:
+                count += 1
+                state_store.update_strokes(count=count, rate=50.0)
+                await asyncio.sleep(0.05)
+
+        changer = asyncio.create_task(change_state())
+
         async with websockets.connect(f"ws://localhost:{ws_server.port}") as ws:
             messages = []
             start = asyncio.get_event_loop().time()
@@ -127,6 +152,57 @@ class TestWebSocketServer:
             # With 0.1s interval over 0.5s, expect ~4-5 messages
             assert len(messages) >= 3
 
+        changer.cancel()
+        await ws_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_not_repushed(self, state_store: StateStore) -> None:
+        """Ticks with unchanged state are skipped until the heartbeat."""
+        ws_server = WebSocketServer(
+            state_store, port=0, push_interval=0.05, heartbeat_interval=10.0
+        )
+        await ws_server.start()
+
+        async with websockets.connect(f"ws://localhost:{ws_server.port}") as ws:
+            # Initial state on connect, then at most one push of the same state
+            await asyncio.wait_for(ws.recv(), timeout=1.0)
+            try:
+                await asyncio.wait_for(ws.recv(), timeout=0.2)
+            except asyncio.TimeoutError:
+                pass
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(ws.recv(), timeout=0.3)
+
+            # A change is pushed on the next tick
+            state_store.update_system(voice_state="listening")
+            msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
+            assert json.loads(msg)["system"]["voice_state"] == "listening"
+
+        await ws_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_repushes_unchanged_state(
+        self, state_store: StateStore
+    ) -> None:
+        """Unchanged state is re-sent every heartbeat_interval."""
+        ws_server = WebSocketServer(
+            state_store, port=0, push_interval=0.05, heartbeat_interval=0.2
+        )
+        await ws_server.start()
+
+        async with websockets.connect(f"ws://localhost:{ws_server.port}") as ws:
+            messages = []
+            start = asyncio.get_event_loop().time()
+            try:
+                while asyncio.get_event_loop().time() - start < 0.7:
+                    messages.append(await asyncio.wait_for(ws.recv(), timeout=0.4))
+            except asyncio.TimeoutError:
+                pass
+
+            # Initial state plus roughly one heartbeat per 0.2s
+            assert 3 <= len(messages) <= 6
+
         await ws_server.stop()
 
     @pytest.mark.asyncio
@@ -144,3 +220,100 @@ class TestWebSocketServer:
 
             assert data["custom"] == "message"
             assert data["value"] == 123
+
+    @pytest.mark.asyncio
+    async def test_slow_client_keeps_latest_messages(
+        self, server: WebSocketServer
+    ) -> None:
+        """A client that is not draining keeps only its newest payloads."""
+
+        class StalledClient:
+            state = State.OPEN
+
+            async def close(self, code: int = 1000) -> None:
+                pass
+
+        stalled = asyncio.Queue(maxsize=server.client_queue_size)
+        server._clients[StalledClient()] = stalled
+
+        async with websockets.connect(f"ws://localhost:{server.port}") as ws:
+            await asyncio.wait_for(ws.recv(), timeout=1.0)
+
+            for value in range(5):
+                await server.broadcast({"value": value})
+                await asyncio.sleep(0.01)
+
+            # The live client is not held back by the stalled one
+            received = [
+                json.loads(await asyncio.wait_for(ws.recv(), timeout=1.0))["value"]
+                for _ in range(5)
+            ]
+            assert received == [0, 1, 2, 3, 4]
+
+        pending = [json.loads(stalled.get_nowait())["value"] for _ in range(2)]
+        assert pending == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_disconnected_client_removed(self, server: WebSocketServer) -> None:
+        """A client is dropped from the set as soon as it disconnects."""
+        async with websockets.connect(f"ws://localhost:{server.port}") as ws:
+            await asyncio.wait_for(ws.recv(), timeout=1.0)
+            assert len(server._clients) == 1
+
+        for _ in range(50):
+            if not server._clients:
+                break
+            await asyncio.sleep(0.01)
+        assert not server._clients
+
+    @pytest.mark.asyncio
+    async def test_send_error_drops_client(
+        self, server: WebSocketServer, mocker, caplog
+    ) -> None:
+        """A send failure is logged and the client disconnected and removed."""
+        mocker.patch(
+            "websockets.asyncio.server.ServerConnection.send",
+            side_effect=TypeError("not serializable"),
+        )
+
+        async with websockets.connect(f"ws://localhost:{server.port}") as ws:
+            with pytest.raises(websockets.ConnectionClosedError) as exc_info:
+                await asyncio.wait_for(ws.recv(), timeout=1.0)
+            assert exc_info.value.rcvd.code == 1011
+
+        for _ in range(50):
+            if not server._clients:
+                break
+            await asyncio.sleep(0.01)
+        assert not server._clients
+        assert "Error sending to client" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_payload_timestamp_refreshed(
+        self, state_store: StateStore
+    ) -> None:
+        """Heartbeats and late clients get a fresh timestamp for unchanged state."""
+        ws_server = WebSocketServer(
+            state_store, port=0, push_interval=0.05, heartbeat_interval=0.2
+        )
+        await ws_server.start()
+
+        async with websockets.connect(f"ws://localhost:{ws_server.port}") as ws:
+            first = json.loads(await asyncio.wait_for(ws.recv(), timeout=1.0))
+            await asyncio.sleep(0.5)
+            heartbeats = []
+            while True:
+                try:
+                    msg = await asyncio.wait_for(ws.recv(), timeout=0.01)
+                except asyncio.TimeoutError:
+                    break
+                heartbeats.append(json.loads(msg))
+            assert heartbeats
+            assert heartbeats[-1]["timestamp"] > first["timestamp"]
+
+        await asyncio.sleep(0.3)
+        async with websockets.connect(f"ws://localhost:{ws_server.port}") as late:
+            data = json.loads(await asyncio.wait_for(late.recv(), timeout=1.0))
+            assert data["timestamp"] > heartbeats[-1]["timestamp"]
+
+        await ws_server.stop()
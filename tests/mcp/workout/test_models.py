@@ -81,6 +81,13 @@ class TestWorkoutSegment:
         assert segment.target_stroke_rate == (50, 55)
         assert segment.notes == "Keep steady"
 
+    def test_segment_from_dict_rejects_invalid_type(self):
+        """Test deserialization rejects unknown or missing segment types."""
+        with pytest.raises(ValueError, match="Invalid segment type: sprint"):
+            WorkoutSegment.from_dict({"type": "sprint"})
+        with pytest.raises(ValueError):
+            WorkoutSegment.from_dict({"target_duration_seconds": 60})
+
 
 class TestWorkout:
     """Test Workout data model."""
@@ -46,6 +46,14 @@ class TestTemplateStorage:
         files = list(template_dir.glob("*.json"))
         assert len(files) == 1
 
+    def test_save_file_mode_follows_umask(self, storage, sample_workout, template_dir):
+        """Template files get the same mode as a plainly written file."""
+        path = storage.save(sample_workout)
+        reference = template_dir / "reference.txt"
+        reference.write_text("")
+
+        assert path.stat().st_mode == reference.stat().st_mode
+
     def test_save_filename(self, storage, sample_workout, template_dir):
         """Test save uses workout name for filename."""
         storage.save(sample_workout)
@@ -156,3 +164,13 @@ class TestTemplateStorage:
         result = storage.delete("nonexistent_id")
 
         assert result is False
+
+    def test_get_renamed_template(self, storage, sample_workout, template_dir):
+        """Test get finds a template whose filename lacks the workout ID."""
+        path = storage.save(sample_workout)
+        path.rename(template_dir / "favourite.json")
+
+        retrieved = storage.get(sample_workout.workout_id)
+
+        assert retrieved is not None
+        assert retrieved.workout_id == sample_workout.workout_id
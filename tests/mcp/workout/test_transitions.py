@@ -434,6 +434,53 @@ class TestTransitionMonitor:
         # With debounce, should NOT trigger immediately
         assert result["should_transition"] is False
 
+    def test_swimming_debounce_elapses(
+        self, state_machine, mock_vision_state_store, monkeypatch
+    ):
+        """Test swimming stop triggers once the debounce period has passed."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "src.mcp.workout.transitions.time.monotonic", lambda: clock[0]
+        )
+        workout = Workout(
+            name="Test",
+            segments=[
+                WorkoutSegment(type="warmup", target_duration_seconds=60),
+                WorkoutSegment(type="work", target_distance_m=100),
+            ],
+        )
+        state_machine.create_workout(workout)
+        state_machine.start_workout()
+        state_machine.advance_segment()  # Move to work
+
+        state_machine._state.segment_started_at = datetime.now(
+            timezone.utc
+        ) - timedelta(seconds=10)
+
+        monitor = TransitionMonitor(
+            state_machine=state_machine,
+            vision_state_store=mock_vision_state_store,
+            grace_period_seconds=0,
+            swimming_debounce_seconds=2.0,
+        )
+
+        mock_vision_state_store.get_state.return_value = MockVisionState(
+            is_swimming=True
+        )
+        monitor.check()
+
+        mock_vision_state_store.get_state.return_value = MockVisionState(
+            is_swimming=False
+        )
+        clock[0] += 0.5
+        assert monitor.check()["should_transition"] is False
+
+        clock[0] += 2.0
+        result = monitor.check()
+
+        assert result["should_transition"] is True
+        assert result["reason"] == "swimming_stopped"
+
     def test_segment_start_grace_period(self, state_machine, mock_vision_state_store):
         """Test grace period after segment start."""
         workout = Workout(
@@ -112,6 +112,17 @@ class TestNotificationManager:
 
         assert "notification sent" in caplog.text.lower()
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_notifier(self, mock_notifier):
+        """aclose releases the notifier's client."""
+        from src.notifications.manager import NotificationManager
+
+        manager = NotificationManager(notifier=mock_notifier)
+
+        await manager.aclose()
+
+        mock_notifier.aclose.assert_awaited_once()
+
 
 class TestNotificationManagerFactory:
     """Test manager creation from config."""
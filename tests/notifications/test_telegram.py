@@ -107,7 +107,7 @@ class TestTelegramNotifier:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await notifier.send("Hello")
 
@@ -126,7 +126,7 @@ class TestTelegramNotifier:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await notifier.send("Hello")
 
@@ -142,7 +142,7 @@ class TestTelegramNotifier:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.RequestError("Connection failed")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await notifier.send("Hello")
 
@@ -184,7 +184,7 @@ class TestTelegramNotifier:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             await notifier.send("Test message")
 
@@ -206,8 +206,34 @@ class TestTelegramNotifier:
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_client.post.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await notifier.send("Hello")
 
             assert result is False
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_sends(self, config):
+        """One HTTP client serves every send until closed."""
+        from src.notifications.telegram import TelegramNotifier
+
+        notifier = TelegramNotifier(config)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_client.post.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            await notifier.send("First")
+            await notifier.send("Second")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.post.call_count == 2
+
+            await notifier.aclose()
+            mock_client.aclose.assert_awaited_once()
+
+            await notifier.send("Third")
+            assert mock_client_class.call_count == 2
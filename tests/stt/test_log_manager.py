@@ -27,6 +27,21 @@ class TestAppendTranscription:
         timestamp_part = lines[0].split(" ")[0]
         datetime.fromisoformat(timestamp_part)  # Raises if invalid
 
+    def test_timestamp_matches_clock(self, log_manager: LogManager, temp_log_path: Path):
+        """Timestamps track the clock across second boundaries."""
+        with freeze_time("2026-01-11 08:30:15.123456"):
+            log_manager.append("first")
+        with freeze_time("2026-01-11 08:30:15.987000"):
+            log_manager.append("second")
+        with freeze_time("2026-01-11 08:30:16.004000"):
+            log_manager.append("third")
+
+        assert temp_log_path.read_text().split("\n")[:3] == [
+            "2026-01-11T08:30:15.123 first",
+            "2026-01-11T08:30:15.987 second",
+            "2026-01-11T08:30:16.004 third",
+        ]
+
     def test_multiple_appends(self, log_manager: LogManager, temp_log_path: Path):
         """Multiple appends create multiple entries in order."""
         log_manager.append("first line")
@@ -60,6 +75,19 @@ class TestAppendTranscription:
         assert log_path.exists()
         assert "first" in log_path.read_text()
 
+    def test_append_after_close(self, log_manager: LogManager, temp_log_path: Path):
+        """Closing the log does not lose entries; a later append reopens it."""
+        log_manager.append("before close")
+        log_manager.close()
+        log_manager.close()  # Idempotent
+        log_manager.append("after close")
+        log_manager.close()
+
+        lines = temp_log_path.read_text().strip().split("\n")
+        assert len(lines) == 2
+        assert "before close" in lines[0]
+        assert "after close" in lines[1]
+
     def test_skip_empty_text(self, log_manager: LogManager, temp_log_path: Path):
         """Empty strings are not written to log."""
         log_manager.append("")
@@ -136,6 +164,26 @@ class TestLogRotation:
         assert "new entry" in log_path.read_text()
         assert "old entry" not in log_path.read_text()
 
+    def test_rotation_checked_once_per_day(self, temp_log_dir: Path):
+        """Repeated calls on the same day skip the file check."""
+        log_path = temp_log_dir / "transcript.log"
+        manager = LogManager(log_path=log_path)
+        yesterday_ts = datetime(2026, 1, 10, 8, 0, 0).timestamp()
+
+        with freeze_time("2026-01-11 08:00:00"):
+            manager.append("entry")
+            manager.rotate_if_needed()
+            os.utime(log_path, (yesterday_ts, yesterday_ts))
+            manager.rotate_if_needed()
+
+        assert log_path.exists()
+
+        with freeze_time("2026-01-12 08:00:00"):
+            manager.rotate_if_needed()
+
+        assert not log_path.exists()
+        assert (temp_log_dir / "transcript.2026-01-10.log").exists()
+
 
 class TestCleanupOldLogs:
     """Tests for cleaning up old log files."""
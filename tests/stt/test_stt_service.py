@@ -1,6 +1,8 @@
 """Tests for STTService - Whisper transcription service."""
 
 import asyncio
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 
@@ -76,6 +78,24 @@ class TestModelLoading:
         call_kwargs = mock_whisper_model.call_args[1]
         assert call_kwargs["device"] == "cpu"
 
+    def test_auto_compute_type_cpu(self, mock_whisper_model):
+        """Auto compute type quantizes to int8 on CPU."""
+        STTService(model_name="small", device="cpu")
+
+        assert mock_whisper_model.call_args[1]["compute_type"] == "int8"
+
+    def test_auto_compute_type_cuda(self, mock_whisper_model):
+        """Auto compute type uses float16 on CUDA."""
+        STTService(model_name="small", device="cuda")
+
+        assert mock_whisper_model.call_args[1]["compute_type"] == "float16"
+
+    def test_explicit_compute_type(self, mock_whisper_model):
+        """Explicit compute type is passed through unchanged."""
+        STTService(model_name="small", device="cpu", compute_type="float32")
+
+        assert mock_whisper_model.call_args[1]["compute_type"] == "float32"
+
     def test_auto_device_with_cuda(self, mock_whisper_model, mocker):
         """Auto device uses CUDA when available."""
         # Mock torch.cuda.is_available to return True
@@ -196,6 +216,40 @@ class TestAudioCapture:
         call_args = service._record_audio.call_args
         assert call_args[0][0] == 48000  # 3.0 * 16000
 
+    def test_record_audio_reuses_stream(self, mock_whisper_model, mocker):
+        """Audio is read from one input stream kept open across chunks."""
+        mock_sd = MagicMock()
+        mock_sd.InputStream.return_value.read.return_value = (
+            np.zeros((1600, 1), dtype=np.float32),
+            False,
+        )
+        mocker.patch.dict("sys.modules", {"sounddevice": mock_sd})
+        service = STTService(model_name="small", chunk_duration=0.1)
+        service._running = True
+
+        first = service._record_audio(1600)
+        second = service._record_audio(1600)
+
+        mock_sd.InputStream.assert_called_once()
+        mock_sd.InputStream.return_value.start.assert_called_once()
+        assert first.shape == second.shape == (1600,)
+
+        service._close_stream()
+        mock_sd.InputStream.return_value.close.assert_called_once()
+
+    def test_record_audio_does_not_open_stream_when_stopped(
+        self, mock_whisper_model, mocker
+    ):
+        """A capture reaching the stream after stop() opens nothing."""
+        mock_sd = MagicMock()
+        mocker.patch.dict("sys.modules", {"sounddevice": mock_sd})
+        service = STTService(model_name="small", chunk_duration=0.1)
+
+        audio = service._record_audio(1600)
+
+        mock_sd.InputStream.assert_not_called()
+        assert audio.shape == (0,)
+
 
 class TestServiceRun:
     """Tests for run method."""
@@ -245,3 +299,128 @@ class TestServiceRun:
             await task
         except asyncio.CancelledError:
             pass  # Expected
+
+    @pytest.mark.asyncio
+    async def test_run_captures_during_transcription(
+        self, mock_whisper_model, temp_log_path: Path
+    ):
+        """Next chunk is captured while the current one is transcribed."""
+        log_manager = LogManager(log_path=temp_log_path)
+        service = STTService(model_name="small", log_manager=log_manager)
+
+        audio = np.random.randn(16000).astype(np.float32)
+        service.capture_chunk = AsyncMock(return_value=audio)
+        captures_at_transcribe = []
+
+        def transcribe(chunk):
+            captures_at_transcribe.append(service.capture_chunk.call_count)
+            service.stop()
+            return "hello world"
+
+        service.transcribe = transcribe
+
+        await asyncio.wait_for(service.run(), timeout=1.0)
+
+        assert captures_at_transcribe == [2]
+        assert "hello world" in temp_log_path.read_text()
+
+    @pytest.mark.asyncio
+    async def test_run_joins_in_flight_work_on_stop(
+        self, mock_whisper_model, temp_log_path: Path
+    ):
+        """Stopping starts no new capture and waits for worker threads."""
+        log_manager = LogManager(log_path=temp_log_path)
+        service = STTService(
+            model_name="small", chunk_duration=0.01, log_manager=log_manager
+        )
+        records = []
+
+        def record_audio(frames):
+            time.sleep(0.05)
+            records.append("done")
+            return np.zeros(frames, dtype=np.float32)
+
+        def transcribe(chunk):
+            service.stop()
+            return "hello world"
+
+        service._record_audio = record_audio
+        service.transcribe = transcribe
+
+        await asyncio.wait_for(service.run(), timeout=1.0)
+
+        # First chunk plus the one captured during transcription, both joined
+        assert records == ["done", "done"]
+        assert not service._pending
+
+    @pytest.mark.asyncio
+    async def test_stop_with_capture_in_flight(
+        self, mock_whisper_model, temp_log_path: Path, mocker
+    ):
+        """The stream is aborted and its reader joined before it is closed."""
+        events = []
+        aborted = threading.Event()
+
+        class FakeInputStream:
+            def __init__(self, **kwargs):
+                events.append("open")
+
+            def start(self):
+                pass
+
+            def read(self, frames):
+                # Block like PortAudio until the chunk fills or abort()
+                if "read" in events and aborted.wait(timeout=0.2):
+                    events.append("read interrupted")
+                    raise RuntimeError("stream aborted")
+                events.append("read")
+                return np.zeros((frames, 1), dtype=np.float32), False
+
+            def abort(self):
+                events.append("abort")
+                aborted.set()
+
+            def close(self):
+                events.append("close")
+
+        mock_sd = MagicMock()
+        mock_sd.InputStream = FakeInputStream
+        mocker.patch.dict("sys.modules", {"sounddevice": mock_sd})
+        log_manager = LogManager(log_path=temp_log_path)
+        service = STTService(
+            model_name="small", chunk_duration=0.1, log_manager=log_manager
+        )
+
+        def transcribe(chunk):
+            # Second capture has started and is blocked in read()
+            time.sleep(0.05)
+            service.stop()
+            return "hello world"
+
+        service.transcribe = transcribe
+
+        await asyncio.wait_for(service.run(), timeout=1.0)
+        await asyncio.sleep(0.3)  # Past the fake read's own timeout
+
+        assert events == ["open", "read", "abort", "read interrupted", "close"]
+        assert service._stream is None
+
+    @pytest.mark.asyncio
+    async def test_chunk_captured_across_stop_is_discarded(
+        self, mock_whisper_model, temp_log_path: Path
+    ):
+        """A chunk whose capture finishes after stop() is not transcribed."""
+        log_manager = LogManager(log_path=temp_log_path)
+        service = STTService(model_name="small", log_manager=log_manager)
+
+        async def capture_chunk():
+            service.stop()
+            return np.zeros(16000, dtype=np.float32)
+
+        service.capture_chunk = capture_chunk
+        service.transcribe = MagicMock(return_value="hello world")
+
+        await asyncio.wait_for(service.run(), timeout=1.0)
+
+        service.transcribe.assert_not_called()
+        assert not temp_log_path.exists()
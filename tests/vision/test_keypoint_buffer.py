@@ -241,3 +241,19 @@ class TestKeypointBuffer:
         assert len(left_pos) == 2
         np.testing.assert_array_almost_equal(left_pos, [100.0, 200.0])
         np.testing.assert_array_almost_equal(left_ts, [0.0, 0.066])
+
+    def test_wrapped_buffer_keeps_frames_in_order(self):
+        """After wrapping, trajectories run oldest to newest with validity."""
+        from src.vision.keypoint_buffer import KeypointBuffer
+
+        buffer = KeypointBuffer(max_size=4, min_confidence=0.5)
+        for i in range(7):
+            pose = make_pose_result(timestamp=i * 0.1, frame_index=i, left_wrist_y=float(i))
+            if i == 5:
+                pose.keypoints[LEFT_WRIST_IDX, 2] = 0.1
+            buffer.add(pose)
+
+        positions, timestamps = buffer.get_wrist_trajectory("left")
+        np.testing.assert_array_equal(positions, [3.0, 4.0, 6.0])
+        np.testing.assert_allclose(timestamps, [0.3, 0.4, 0.6], rtol=1e-6)
+        np.testing.assert_allclose(buffer.get_timestamps(), [0.3, 0.4, 0.5, 0.6], rtol=1e-6)
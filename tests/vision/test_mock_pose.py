@@ -117,6 +117,20 @@ class TestSineWavePoseEstimator:
         correlation = np.corrcoef(left_norm, right_norm)[0, 1]
         assert correlation < -0.9, f"Wrists should be anti-correlated, got {correlation}"
 
+    def test_results_do_not_share_keypoints(self):
+        """Poses kept across frames keep their own keypoints."""
+        from src.vision.backends.mock_pose import SineWavePoseEstimator
+
+        estimator = SineWavePoseEstimator(stroke_rate=60.0, seed=42)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        first = estimator.estimate(frame, timestamp=0.25, frame_index=0)
+        expected = first.keypoints.copy()
+        second = estimator.estimate(frame, timestamp=0.5, frame_index=1)
+
+        assert second.keypoints is not first.keypoints
+        np.testing.assert_array_equal(first.keypoints, expected)
+
     def test_is_available_always_true(self):
         """Mock estimator is always available."""
         from src.vision.backends.mock_pose import SineWavePoseEstimator
@@ -192,6 +206,37 @@ class TestFilePoseEstimator:
         result2 = estimator.estimate(frame, timestamp=0.033, frame_index=1)
         assert result2 is None
 
+    def test_replays_recorded_values(self, tmp_path):
+        """Replayed results match the recorded frames in order."""
+        from src.vision.backends.mock_pose import FilePoseEstimator
+        import json
+
+        recorded = [np.random.rand(17, 3).astype(np.float32) for _ in range(3)]
+        keypoints_data = [
+            {
+                "keypoints": kp.tolist(),
+                "bbox": [100, 100, 500, 400] if i != 1 else None,
+                "confidence": 0.9 + i / 100,
+                "timestamp": i / 30.0,
+                "frame_index": i,
+            }
+            for i, kp in enumerate(recorded)
+        ]
+
+        keypoints_file = tmp_path / "keypoints.json"
+        keypoints_file.write_text(json.dumps(keypoints_data))
+
+        estimator = FilePoseEstimator(keypoints_file)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        for i, kp in enumerate(recorded):
+            result = estimator.estimate(frame, timestamp=0.0, frame_index=99)
+            np.testing.assert_array_equal(result.keypoints, kp)
+            assert result.bbox == (None if i == 1 else (100, 100, 500, 400))
+            assert result.confidence == keypoints_data[i]["confidence"]
+            assert result.timestamp == keypoints_data[i]["timestamp"]
+            assert result.frame_index == i
+
     def test_is_available_checks_file_exists(self, tmp_path):
         """is_available returns True only if file exists."""
         from src.vision.backends.mock_pose import FilePoseEstimator
@@ -259,6 +304,20 @@ class TestRandomPoseEstimator:
 
         np.testing.assert_array_equal(result1.keypoints, result2.keypoints)
 
+    def test_results_do_not_share_keypoints(self):
+        """Poses kept across frames keep their own keypoints."""
+        from src.vision.backends.mock_pose import RandomPoseEstimator
+
+        estimator = RandomPoseEstimator(seed=42)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        first = estimator.estimate(frame, timestamp=0.0, frame_index=0)
+        expected = first.keypoints.copy()
+        second = estimator.estimate(frame, timestamp=0.1, frame_index=1)
+
+        assert second.keypoints is not first.keypoints
+        np.testing.assert_array_equal(first.keypoints, expected)
+
     def test_is_available_always_true(self):
         """Mock estimator is always available."""
         from src.vision.backends.mock_pose import RandomPoseEstimator
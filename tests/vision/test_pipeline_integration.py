@@ -123,6 +123,66 @@ class TestVisionPipelineIntegration:
         state = state_store.get_state()
         assert expected_range[0] <= state.stroke_rate <= expected_range[1]
 
+    def test_stroke_detection_scans_tail_window(self, mock_pipeline, mocker):
+        """Detection runs on a bounded tail, gated by min_peak_distance."""
+        detect = mocker.spy(mock_pipeline.stroke_detector, "detect_strokes")
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        for i in range(300):
+            mock_pipeline.process_frame(frame, timestamp=i / 30.0, frame_index=i)
+
+        # 0.3 s gate at 30 fps: roughly one scan every 9 frames, not per frame
+        assert 25 <= detect.call_count <= 35
+        # Once strokes are found, scans start 1.2 s before the last stroke:
+        # about one 1 s stroke period plus lookback, not the whole buffer
+        assert all(len(call.args[0]) <= 90 for call in detect.call_args_list[5:])
+        assert mock_pipeline.state_store.get_state().stroke_count >= 8
+
+    @pytest.mark.parametrize(
+        "stroke_rate,amplitude", [(15.0, 30.0), (20.0, 20.0), (30.0, 20.0)]
+    )
+    def test_slow_strokes_match_full_buffer_detection(
+        self, stroke_rate: float, amplitude: float
+    ):
+        """Incremental detection counts slow strokes like a full-buffer scan."""
+        from src.vision.backends.mock_pose import SineWavePoseEstimator
+        from src.vision.pipeline import VisionPipeline
+        from src.vision.state_store import StateStore
+
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        pipeline = VisionPipeline(
+            pose_estimator=SineWavePoseEstimator(
+                stroke_rate=stroke_rate, amplitude=amplitude
+            ),
+            state_store=StateStore(),
+        )
+        reference = VisionPipeline(
+            pose_estimator=SineWavePoseEstimator(
+                stroke_rate=stroke_rate, amplitude=amplitude
+            ),
+            state_store=StateStore(),
+        )
+
+        # Reference: rescan the whole buffer every frame
+        last_stroke = -1.0
+        expected = 0
+        for i in range(1800):
+            timestamp = i / 30.0
+            pipeline.process_frame(frame, timestamp=timestamp, frame_index=i)
+            reference.buffer.add(
+                reference.pose_estimator.estimate(frame, timestamp, i)
+            )
+            wrist_y, wrist_timestamps = reference.buffer.get_wrist_trajectory()
+            for stroke in reference.stroke_detector.detect_strokes(
+                wrist_y, wrist_timestamps
+            ):
+                if stroke.timestamp > last_stroke:
+                    last_stroke = stroke.timestamp
+                    expected += 1
+
+        assert expected >= stroke_rate - 1
+        assert pipeline.rate_calculator.get_stroke_count() == expected
+
     def test_run_with_video_source(self):
         """Pipeline can run on a video source."""
         from src.vision.backends.mock_pose import SineWavePoseEstimator
@@ -141,6 +201,107 @@ class TestVisionPipelineIntegration:
         assert state.stroke_count >= 3
         assert state.pose_detected is True
 
+    def test_run_batches_frames(self):
+        """run() sends frames to estimate_batch in batches, preserving results."""
+        import dataclasses
+
+        from src.vision.backends.mock_pose import SineWavePoseEstimator
+        from src.vision.pipeline import VisionPipeline
+        from src.vision.state_store import StateStore
+        from src.vision.video_capture import MockVideoSource
+
+        class BatchingEstimator(SineWavePoseEstimator):
+            batch_sizes: list[int] = []
+
+            def estimate_batch(self, frames, timestamps, frame_indices):
+                self.batch_sizes.append(len(frames))
+                return [
+                    dataclasses.replace(r, keypoints=r.keypoints.copy())
+                    for r in map(self.estimate, frames, timestamps, frame_indices)
+                ]
+
+        serial_store = StateStore()
+        VisionPipeline(
+            pose_estimator=SineWavePoseEstimator(stroke_rate=60.0, seed=42),
+            state_store=serial_store,
+        ).run(MockVideoSource(fps=30.0, duration=5.0))
+
+        estimator = BatchingEstimator(stroke_rate=60.0, seed=42)
+        batched_store = StateStore()
+        VisionPipeline(
+            pose_estimator=estimator, state_store=batched_store, batch_size=4
+        ).run(MockVideoSource(fps=30.0, duration=5.0))
+
+        assert estimator.batch_sizes == [4] * 37 + [2]
+        serial, batched = serial_store.get_state(), batched_store.get_state()
+        assert batched.stroke_count == serial.stroke_count
+        assert batched.stroke_rate == serial.stroke_rate
+
+    def test_run_drop_frames_keeps_latest(self):
+        """With drop_frames, a slow estimator skips stale frames but sees the last."""
+        import time
+
+        from src.vision.pipeline import VisionPipeline
+        from src.vision.state_store import StateStore
+
+        class SlowEstimator:
+            def __init__(self):
+                self.seen: list[int] = []
+
+            def estimate(self, frame, timestamp, frame_index):
+                time.sleep(0.005)
+                self.seen.append(frame_index)
+                return None
+
+            def is_available(self):
+                return True
+
+        class BurstSource:
+            fps = 30.0
+
+            def frames(self):
+                frame = np.zeros((4, 4, 3), dtype=np.uint8)
+                for i in range(50):
+                    yield frame, i / 30.0, i
+
+            def close(self):
+                pass
+
+        estimator = SlowEstimator()
+        pipeline = VisionPipeline(pose_estimator=estimator, state_store=StateStore())
+
+        pipeline.run(BurstSource(), drop_frames=True)
+
+        assert len(estimator.seen) < 50
+        assert estimator.seen == sorted(estimator.seen)
+        assert estimator.seen[-1] == 49
+
+    def test_run_reraises_source_error(self):
+        """Errors raised by the video source surface from run()."""
+        from src.vision.backends.mock_pose import SineWavePoseEstimator
+        from src.vision.pipeline import VisionPipeline
+        from src.vision.state_store import StateStore
+
+        class BrokenSource:
+            fps = 30.0
+            closed = False
+
+            def frames(self):
+                yield np.zeros((4, 4, 3), dtype=np.uint8), 0.0, 0
+                raise IOError("camera unplugged")
+
+            def close(self):
+                self.closed = True
+
+        source = BrokenSource()
+        pipeline = VisionPipeline(
+            pose_estimator=SineWavePoseEstimator(), state_store=StateStore()
+        )
+
+        with pytest.raises(IOError, match="camera unplugged"):
+            pipeline.run(source)
+        assert source.closed is True
+
     def test_pipeline_handles_no_detection(self):
         """Pipeline handles frames with no pose detection."""
         from src.vision.pipeline import VisionPipeline
@@ -71,6 +71,20 @@ class TestRateCalculator:
 
         assert calc.get_stroke_count() == 100
 
+    def test_stroke_count_survives_window_pruning(self):
+        """Strokes dropped from the window still count toward the total."""
+        from src.vision.rate_calculator import RateCalculator
+
+        calc = RateCalculator(window_seconds=5.0)
+
+        for i in range(100):
+            calc.add_stroke(float(i))
+            calc.get_rate(current_time=float(i))
+
+        assert calc.get_stroke_count() == 100
+        assert len(calc._stroke_times) == 6  # strokes at 94..99
+        assert calc.get_rate(current_time=99.0) == pytest.approx(60.0)
+
     def test_reset_clears_history(self):
         """Reset clears all strokes."""
         from src.vision.rate_calculator import RateCalculator
@@ -173,6 +173,21 @@ class TestStateStore:
         state2 = store.get_state()
         assert state2.stroke_count == 10  # Original unchanged
 
+    def test_rate_history_shared_as_immutable_tuple(self):
+        """rate_history is stored as a tuple and not copied per read."""
+        from src.vision.rate_calculator import RateSample
+        from src.vision.state_store import StateStore
+
+        store = StateStore()
+        history = [RateSample(timestamp=0.0, rate=60.0)]
+        store.update(rate_history=history)
+        history.append(RateSample(timestamp=5.0, rate=62.0))
+
+        state1 = store.get_state()
+        state2 = store.get_state()
+        assert state1.rate_history == (RateSample(timestamp=0.0, rate=60.0),)
+        assert state1.rate_history is state2.rate_history
+
     def test_update_preserves_unmodified_fields(self):
         """Partial updates preserve other fields."""
         from src.vision.state_store import StateStore
@@ -191,3 +191,15 @@ class TestStrokeDetector:
         )
 
         assert len(strokes) == 0
+
+    @pytest.mark.parametrize("count", [3, 4, 11, 30])
+    def test_median_interval_matches_numpy(self, count: int):
+        """Sample spacing matches np.median(np.diff(...)) for odd/even sizes."""
+        from src.vision.stroke_detector import StrokeDetector
+
+        rng = np.random.default_rng(count)
+        timestamps = np.cumsum(rng.uniform(0.02, 0.05, count))
+
+        assert StrokeDetector._median_interval(timestamps) == pytest.approx(
+            float(np.median(np.diff(timestamps)))
+        )
@@ -1,5 +1,8 @@
 """Tests for video capture sources."""
 
+import sys
+from unittest.mock import MagicMock
+
 import numpy as np
 import pytest
 
@@ -83,6 +86,17 @@ class TestMockVideoSource:
         assert np.all(frame[:, :, 2] == 0)  # R
 
 
+    def test_frames_share_one_read_only_buffer(self):
+        """Frames are one preallocated array that consumers cannot modify."""
+        from src.vision.video_capture import MockVideoSource
+
+        source = MockVideoSource(fps=30.0, duration=0.1)
+
+        frames = [frame for frame, _, _ in source.frames()]
+
+        assert all(frame is frames[0] for frame in frames)
+        assert not frames[0].flags.writeable
+
 class TestFileVideoSource:
     """Tests for FileVideoSource."""
 
@@ -110,3 +124,38 @@ class TestFileVideoSource:
         source._cap = None
 
         source.close()  # Should not raise
+
+    def test_hw_decode_opens_gstreamer_pipeline(self, tmp_path, mocker):
+        """hw_decode opens the file through the NVDEC GStreamer pipeline."""
+        from src.vision.video_capture import FileVideoSource
+
+        cv2 = MagicMock()
+        mocker.patch.dict(sys.modules, {"cv2": cv2})
+        video_file = tmp_path / "swim.mp4"
+        video_file.touch()
+
+        FileVideoSource(video_file, hw_decode=True)
+
+        cv2.VideoCapture.assert_called_once()
+        source, api = cv2.VideoCapture.call_args[0]
+        assert f'location="{video_file}"' in source
+        assert "nvv4l2decoder" in source
+        assert api is cv2.CAP_GSTREAMER
+
+    def test_hw_decode_falls_back_to_cpu(self, tmp_path, mocker):
+        """If the GStreamer pipeline can't open, the default decoder is used."""
+        from src.vision.video_capture import FileVideoSource
+
+        cv2 = MagicMock()
+        gst_cap, cpu_cap = MagicMock(), MagicMock()
+        gst_cap.isOpened.return_value = False
+        cv2.VideoCapture.side_effect = [gst_cap, cpu_cap]
+        mocker.patch.dict(sys.modules, {"cv2": cv2})
+        video_file = tmp_path / "swim.mp4"
+        video_file.touch()
+
+        source = FileVideoSource(video_file, hw_decode=True)
+
+        gst_cap.release.assert_called_once()
+        assert cv2.VideoCapture.call_args == ((str(video_file),),)
+        assert source._cap is cpu_cap
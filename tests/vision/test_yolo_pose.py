@@ -0,0 +1,153 @@
+"""Tests for YoloPoseEstimator with a stubbed ultralytics model."""
+
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.vision.protocols import NUM_KEYPOINTS
+
+
+class _DeviceTensor:
+    """Minimal stand-in for a torch tensor left on the inference device."""
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+        self.copied = False
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index) -> "_DeviceTensor":
+        return _DeviceTensor(self._array[index])
+
+    def __float__(self) -> float:
+        return float(self._array)
+
+    def argmax(self) -> int:
+        return int(np.argmax(self._array))
+
+    def cpu(self) -> "_DeviceTensor":
+        self.copied = True
+        return self
+
+    def numpy(self) -> np.ndarray:
+        assert self.copied, "numpy() without cpu() on a device tensor"
+        return self._array
+
+
+def _detection(conf: float, *extra_confs: float) -> MagicMock:
+    """Fake per-frame YOLO result; extra_confs add more detected people."""
+    confs = np.array([conf, *extra_confs], dtype=np.float32)
+    result = MagicMock()
+    result.keypoints.xy = _DeviceTensor(
+        np.zeros((len(confs), NUM_KEYPOINTS, 2), dtype=np.float32)
+    )
+    result.keypoints.data = _DeviceTensor(
+        np.repeat(confs[:, None, None], NUM_KEYPOINTS * 3, axis=1).reshape(
+            len(confs), NUM_KEYPOINTS, 3
+        )
+    )
+    result.boxes.conf = _DeviceTensor(confs)
+    result.boxes.xyxy = _DeviceTensor(
+        np.array([[10, 20, 30, 40]] * len(confs), dtype=np.float32)
+    )
+    return result
+
+
+@pytest.fixture
+def ultralytics(mocker):
+    """Patch the ultralytics module."""
+    module = MagicMock()
+    mocker.patch.dict(sys.modules, {"ultralytics": module})
+    return module
+
+
+@pytest.fixture
+def yolo_model(ultralytics):
+    """Model instance created by the patched ultralytics.YOLO."""
+    return ultralytics.YOLO.return_value
+
+
+class TestYoloPoseEstimator:
+    """Tests for YoloPoseEstimator."""
+
+    def test_warmup_runs_dummy_inference(self, yolo_model):
+        """Loading the model runs the configured number of warm-up passes."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        estimator = YoloPoseEstimator(device="cpu", warmup_runs=2)
+        estimator.warmup()
+        estimator.warmup()  # Already loaded: no extra passes
+
+        assert yolo_model.predict.call_count == 2
+
+    def test_estimate_batch_one_predict_call(self, yolo_model):
+        """A batch of frames is sent to the model in a single predict call."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        estimator = YoloPoseEstimator(device="cpu", warmup_runs=0)
+        yolo_model.predict.return_value = [_detection(0.9), _detection(0.8)]
+        frames = [np.zeros((480, 640, 3), dtype=np.uint8)] * 2
+
+        results = estimator.estimate_batch(frames, [0.0, 0.1], [0, 1])
+
+        yolo_model.predict.assert_called_once()
+        assert len(yolo_model.predict.call_args[1]["source"]) == 2
+        assert [r.frame_index for r in results] == [0, 1]
+        assert [r.timestamp for r in results] == [0.0, 0.1]
+        assert results[0].confidence == pytest.approx(0.9)
+        assert results[1].bbox == (10, 20, 30, 40)
+        assert results[1].keypoints.shape == (NUM_KEYPOINTS, 3)
+
+    def test_exports_tensorrt_engine_on_cuda(self, ultralytics, tmp_path):
+        """A .pt model on CUDA is exported once and the engine is loaded."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        model_path = tmp_path / "pose.pt"
+        engine_path = tmp_path / "pose.engine"
+        ultralytics.YOLO.return_value.export.return_value = str(engine_path)
+
+        YoloPoseEstimator(model_path=model_path, device=0, warmup_runs=0).warmup()
+
+        ultralytics.YOLO.return_value.export.assert_called_once()
+        assert ultralytics.YOLO.call_args[0][0] == str(engine_path)
+
+    def test_reuses_cached_engine(self, ultralytics, tmp_path):
+        """An existing engine next to the .pt model is loaded without export."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        model_path = tmp_path / "pose.pt"
+        engine_path = tmp_path / "pose.engine"
+        engine_path.touch()
+
+        YoloPoseEstimator(model_path=model_path, device=0, warmup_runs=0).warmup()
+
+        ultralytics.YOLO.return_value.export.assert_not_called()
+        ultralytics.YOLO.assert_called_once_with(str(engine_path), task="pose")
+
+    def test_export_failure_falls_back(self, ultralytics, tmp_path):
+        """A failed export loads the original model."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        model_path = tmp_path / "pose.pt"
+        ultralytics.YOLO.return_value.export.side_effect = RuntimeError("no trt")
+
+        YoloPoseEstimator(model_path=model_path, device=0, warmup_runs=0).warmup()
+
+        assert ultralytics.YOLO.call_args[0][0] == str(model_path)
+
+    def test_copies_only_best_detection_to_host(self, yolo_model):
+        """The best person is picked on device; result.numpy() is never used."""
+        from src.vision.backends.yolo_pose import YoloPoseEstimator
+
+        estimator = YoloPoseEstimator(device="cpu", warmup_runs=0)
+        detection = _detection(0.4, 0.95, 0.6)
+        yolo_model.predict.return_value = [detection]
+
+        result = estimator.estimate(np.zeros((480, 640, 3), dtype=np.uint8), 0.0, 0)
+
+        detection.numpy.assert_not_called()
+        assert result.confidence == pytest.approx(0.95)
+        np.testing.assert_allclose(result.keypoints, 0.95)